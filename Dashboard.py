@@ -1,15 +1,870 @@
+import argparse  # Importa el módulo argparse para leer las opciones de la línea de comandos
+import ast  # Importa ast para extraer las clases y funciones de cada script
+import base64  # Importa base64 para enviar el código compilado dentro de la petición JSON
+import asyncio  # Importa asyncio para ejecutar varios scripts a la vez en segundo plano
+import atexit  # Importa el módulo atexit para cerrar los intérpretes al salir
+import concurrent.futures  # Importa el pool de procesos del modo por lotes
+import collections  # Importa collections para guardar las últimas líneas de salida de cada trabajo
+import cProfile  # Importa cProfile para medir el tiempo de cada función en el modo de perfilado
+import hashlib  # Importa hashlib para identificar el código compilado por el contenido del script
+import json  # Importa el módulo json para guardar el catálogo de scripts en disco
+import marshal  # Importa marshal para guardar en disco el código ya compilado
+import mmap  # Importa el módulo mmap para leer páginas del código sin cargar el archivo entero
 import os  # Importa el módulo os para interactuar con el sistema operativo
+import re  # Importa el módulo re para reconocer las carpetas de cada semana
+import platform  # Importa el módulo platform para anotar la versión de Python en los reportes
+import pstats  # Importa pstats para leer y comparar los perfiles guardados
+import shutil  # Importa el módulo shutil para copiar los archivos de datos de cada script
+import signal  # Importa signal para reconocer los procesos detenidos por el límite de CPU
 import subprocess  # Importa el módulo subprocess para ejecutar comandos del sistema
+import sys  # Importa el módulo sys para conocer el intérprete y los argumentos
+import tempfile  # Importa el módulo tempfile para crear el script de la medición de latencia
+import threading  # Importa threading para mantener el bucle de asyncio junto al menú
+import time  # Importa el módulo time para medir la latencia de arranque
+import traceback  # Importa traceback para mostrar el error de un script que se quedó sin memoria
+import tracemalloc  # Importa tracemalloc para saber qué líneas reservan más memoria
+import types  # Importa types para crear el módulo __main__ aislado de cada script
+from array import array  # Importa array para guardar los desplazamientos de cada línea de forma compacta
+
+try:
+    import resource  # Límites de CPU y memoria por proceso (solo en sistemas Unix)
+except ImportError:
+    resource = None
+
+# Carpeta (junto a este archivo) donde el Dashboard guarda sus índices y cachés
+CARPETA_DATOS = '.dashboard'
+
+# Patrón que reconoce las carpetas de unidades ("Semana 2", "Semana 16", ...)
+PATRON_UNIDAD = re.compile(r'Semana (\d+)')
+
+# Carpeta con las entradas (stdin) para los scripts que piden datos con input() en el modo por lotes
+CARPETA_ENTRADAS = 'entradas'
+
+# Cantidad de líneas de código que se muestran en cada página del visor
+LINEAS_POR_PAGINA = 40
+
+# Cantidad de funciones y de líneas que se muestran en los resúmenes de perfilado
+TOP_PERFIL = 10
+
+# Cantidad de líneas de salida que se guardan de cada trabajo en segundo plano
+LINEAS_POR_TRABAJO = 1000
+
+# Límites por defecto del modo por lotes: nadie responde a un input() ni cierra una ventana
+LIMITES_LOTE = {'tiempo_real': 60, 'tiempo_cpu': 30, 'memoria_mb': 1024}
+
+# Programa mínimo que ejecuta un script del modo por lotes y, al salir, anota su pico de memoria.
+# El hijo nace de un fork del proceso del pool y en Linux su ru_maxrss incluye la memoria que ese
+# proceso tenía al hacer el fork; VmHWM, en cambio, vuelve a empezar con el exec. No se usa el
+# ejecutor del Dashboard (--ejecutar) porque sus importaciones sumarían unos 14 MB a cada script.
+LANZADOR_LOTE = r"""
+import atexit, os, sys
+def _anotar_memoria(ruta_memoria=sys.argv[2]):
+    try:
+        with open('/proc/self/status') as estado:
+            pico_kb = next(int(linea.split()[1]) for linea in estado if linea.startswith('VmHWM:'))
+    except OSError:  # Sin /proc (macOS): el pico que informa el propio proceso
+        import resource
+        pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        pico_kb = pico_kb // 1024 if sys.platform == 'darwin' else pico_kb
+    with open(ruta_memoria, 'w') as archivo:
+        archivo.write(str(pico_kb))
+atexit.register(_anotar_memoria)
+__file__ = sys.argv[1]
+sys.argv = sys.argv[1:2]
+sys.path[0] = os.path.dirname(__file__)
+with open(__file__, 'rb') as _archivo:
+    _codigo = compile(_archivo.read(), __file__, 'exec')
+exec(_codigo)
+"""
+
+# Código de salida con el que el ejecutor del Dashboard indica que el script se quedó sin memoria
+CODIGO_SIN_MEMORIA = 99
+
+# Mensajes para los resultados de una corrida que no terminó bien
+MENSAJES_RESULTADO = {
+    'error': "El script terminó con un error (código {codigo}).",
+    'limite_tiempo': "El script superó el límite de tiempo real y se detuvo.",
+    'limite_cpu': "El script superó el límite de tiempo de CPU y se detuvo.",
+    'limite_memoria': "El script superó el límite de memoria y se detuvo.",
+}
+
+# Cantidad máxima de salidas memorizadas; al pasarla se descarta la usada hace más tiempo
+MEMO_MAX_ENTRADAS = 64
+
+# Módulos y funciones que hacen que la salida de un script pueda cambiar entre corridas
+MODULOS_NO_DETERMINISTAS = {'asyncio', 'datetime', 'multiprocessing', 'os', 'random', 'secrets', 'socket',
+                            'subprocess', 'sys', 'threading', 'time', 'tkcalendar', 'tkinter', 'uuid'}
+FUNCIONES_NO_DETERMINISTAS = {'hash', 'id', 'input', 'open'}
+
+# Número de intérpretes que se mantienen arrancados a la espera de un script
+TAMANO_POOL = 2
+
+# Módulos que cada intérprete importa mientras espera, para que el script no pague ese coste
+MODULOS_PRECARGADOS = ('abc', 'json', 'tkinter', 'tkinter.ttk', 'tkinter.messagebox')
+
+
+class PoolInterpretes:
+    """
+    Mantiene un grupo de intérpretes de Python ya arrancados y a la espera de un script.
+
+    Cada intérprete ejecuta un único script en un módulo __main__ limpio y después termina;
+    en cuanto se entrega un script se arranca otro que ocupa su lugar.
+    """
+
+    def __init__(self, tamano=TAMANO_POOL, stdout=None):
+        self.tamano = tamano  # Cantidad de intérpretes que se mantienen listos
+        self.stdout = stdout  # Salida estándar de los intérpretes (None hereda la del Dashboard)
+        self.trabajadores = []  # Lista de tuplas (proceso, descriptor del canal de órdenes)
+        self.rellenar()  # Arranca los intérpretes iniciales
+
+    def _arrancar_trabajador(self):
+        # El canal es una tubería adicional: stdin queda libre para el input() del script
+        lectura, escritura = os.pipe()
+        proceso = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--trabajador', str(lectura)],
+            pass_fds=(lectura,), stdout=self.stdout)
+        os.close(lectura)  # El extremo de lectura solo lo necesita el intérprete
+        return proceso, escritura
+
+    def rellenar(self):
+        # Descarta los intérpretes que hayan terminado y arranca los que falten
+        vivos = []
+        for proceso, canal in self.trabajadores:
+            if proceso.poll() is None:
+                vivos.append((proceso, canal))
+            else:
+                os.close(canal)
+        self.trabajadores = vivos
+        while len(self.trabajadores) < self.tamano:
+            self.trabajadores.append(self._arrancar_trabajador())
+
+    def lanzar(self, ruta_script, **opciones):
+        """
+        Entrega el script a un intérprete listo y devuelve su proceso sin esperar a que termine.
+
+        Las opciones (por ejemplo perfil=prefijo) viajan junto con la ruta en la petición JSON.
+        """
+        peticion = dict(opciones, ruta=os.path.abspath(ruta_script))
+        try:
+            # El código compilado sale de la caché en memoria de este proceso, que vive toda la sesión
+            peticion['codigo'] = base64.b64encode(codigo_serializado(peticion['ruta'])).decode('ascii')
+        except (SyntaxError, ValueError, OSError):
+            # Sin código: el intérprete intenta compilarlo y muestra el error como "python script.py",
+            # y la corrida termina con un código de salida que queda en el historial
+            pass
+        self.rellenar()
+        proceso, canal = self.trabajadores.pop(0)
+        try:
+            os.write(canal, (json.dumps(peticion) + '\n').encode('utf-8'))
+        finally:
+            os.close(canal)  # Al cerrar el canal el intérprete ya no recibirá más órdenes
+        return proceso
+
+    def ejecutar(self, ruta_script, tiempo_real=None, **opciones):
+        """
+        Ejecuta el script en un intérprete del grupo y espera a que termine.
+
+        Si pasa tiempo_real segundos, el vigilante detiene el proceso. Devuelve la tupla
+        (código de salida, True si se detuvo por el límite de tiempo real).
+        """
+        proceso = self.lanzar(ruta_script, **opciones)
+        excedio_tiempo = False
+        try:
+            codigo_salida = proceso.wait(timeout=tiempo_real)
+        except subprocess.TimeoutExpired:
+            excedio_tiempo = True
+            proceso.kill()
+            codigo_salida = proceso.wait()
+        # El reemplazo arranca cuando el script termina, para no quitarle CPU mientras se ejecuta
+        self.rellenar()
+        return codigo_salida, excedio_tiempo
+
+    def cerrar(self):
+        # Cerrar el canal sin enviar ruta hace que cada intérprete termine por sí solo
+        for proceso, canal in self.trabajadores:
+            os.close(canal)
+        for proceso, canal in self.trabajadores:
+            try:
+                proceso.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proceso.kill()
+        self.trabajadores = []
+
+
+def trabajador(descriptor):
+    """Punto de entrada de cada intérprete del grupo: precarga módulos y espera un script."""
+    for modulo in MODULOS_PRECARGADOS:
+        try:
+            __import__(modulo)
+        except ImportError:
+            pass  # Un módulo opcional que falte no impide ejecutar el script
+    with os.fdopen(descriptor, 'r', encoding='utf-8') as canal:
+        linea = canal.readline().strip()
+    if not linea:  # El Dashboard cerró el canal sin enviar ningún script
+        return
+    ejecutar_peticion(json.loads(linea))
+
+
+# Código ya compilado y serializado con marshal: {clave: bytes}. Sirve en el proceso del Dashboard,
+# que dura toda la sesión; cada intérprete del grupo ejecuta un solo script y recibe el código hecho.
+_codigo_compilado = {}
+
+
+def codigo_serializado(ruta_script):
+    """
+    Devuelve el código compilado del script serializado con marshal, compilándolo solo si no está en la caché.
+
+    La clave es el hash SHA-256 de la ruta y el contenido del archivo, así que cualquier cambio
+    en el código usa una entrada nueva. La caché vive en memoria y en .dashboard/codigo
+    (un archivo por clave y versión de Python, porque marshal depende de ella).
+    """
+    with open(ruta_script, 'rb') as archivo:
+        fuente = archivo.read()
+    clave = hashlib.sha256(ruta_script.encode('utf-8') + b'\0' + fuente).hexdigest()
+    serializado = _codigo_compilado.get(clave)
+    if serializado is not None:
+        return serializado
+
+    ruta_cache = ruta_datos('codigo', f"{clave}.{sys.implementation.cache_tag}.bin")
+    try:
+        with open(ruta_cache, 'rb') as archivo:
+            serializado = archivo.read()
+        marshal.loads(serializado)  # Comprueba que la entrada no esté dañada
+    except (FileNotFoundError, EOFError, ValueError, TypeError):  # Sin entrada o entrada dañada
+        serializado = marshal.dumps(compile(fuente, ruta_script, 'exec', dont_inherit=True))
+        temporal = f"{ruta_cache}.{os.getpid()}.tmp"  # Otro intérprete puede estar escribiendo la misma entrada
+        with open(temporal, 'wb') as archivo:
+            archivo.write(serializado)
+        os.replace(temporal, ruta_cache)
+    _codigo_compilado[clave] = serializado
+    return serializado
+
+
+def obtener_codigo(ruta_script):
+    """Devuelve el objeto de código del script (desde la caché si está)."""
+    return marshal.loads(codigo_serializado(ruta_script))
+
+
+def ejecutar_modulo(ruta_script, codigo=None):
+    # Ejecuta el código en un módulo __main__ nuevo, como haría "python script.py"
+    modulo = types.ModuleType('__main__')
+    modulo.__file__ = ruta_script
+    modulo.__builtins__ = __builtins__
+    principal = sys.modules['__main__']
+    sys.modules['__main__'] = modulo  # pickle y multiprocessing buscan las clases del script aquí
+    try:
+        exec(codigo or obtener_codigo(ruta_script), modulo.__dict__)
+    finally:
+        sys.modules['__main__'] = principal
+
+
+def aplicar_limites(limites):
+    """
+    Aplica al proceso actual los límites de CPU (segundos) y memoria (MB) con rlimits.
+
+    Al pasar el límite blando de CPU el sistema envía SIGXCPU; un segundo después, SIGKILL.
+    El límite de tiempo real no es un rlimit: lo vigila quien lanzó el proceso.
+    """
+    if resource is None or not limites:
+        return
+    if limites.get('tiempo_cpu'):
+        segundos = int(limites['tiempo_cpu'])
+        resource.setrlimit(resource.RLIMIT_CPU, (segundos, segundos + 1))
+    if limites.get('memoria_mb'):
+        tamano = int(limites['memoria_mb']) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (tamano, tamano))
+
+
+def clasificar_resultado(codigo_salida, excedio_tiempo, limites=None, salida_error=''):
+    """Devuelve 'ok', 'error', 'limite_tiempo', 'limite_cpu' o 'limite_memoria' según cómo terminó la corrida."""
+    if excedio_tiempo:
+        return 'limite_tiempo'
+    if codigo_salida == 0:
+        return 'ok'
+    if limites and limites.get('tiempo_cpu') and hasattr(signal, 'SIGXCPU'):
+        # SIGXCPU al pasar el límite blando, SIGKILL si el script ignoró esa señal
+        if codigo_salida in (-signal.SIGXCPU, -signal.SIGKILL):
+            return 'limite_cpu'
+    if codigo_salida == CODIGO_SIN_MEMORIA or 'MemoryError' in salida_error:
+        return 'limite_memoria'
+    return 'error'
+
+
+def registrar_corrida(ruta_script, modo, resultado, codigo_salida, tiempo_real):
+    """Agrega una línea JSON con el resultado de la corrida al historial (.dashboard/historial.jsonl)."""
+    ruta_base = os.path.dirname(os.path.abspath(__file__))
+    registro = {
+        'fecha': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'script': os.path.relpath(os.path.abspath(ruta_script), ruta_base).replace(os.sep, '/'),
+        'modo': modo,  # 'interactivo', 'memorizado', 'segundo_plano' o 'lote'
+        'resultado': resultado,
+        'codigo_salida': codigo_salida,
+        'tiempo_real_s': round(tiempo_real, 4),
+    }
+    with open(ruta_datos('historial.jsonl'), 'a', encoding='utf-8') as archivo:
+        archivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+
+
+def ejecutar_peticion(peticion):
+    """
+    Ejecuta el script de la petición en este intérprete.
+
+    Si la petición trae 'salida', stdout y stderr van a ese archivo y stdin sale del archivo
+    'entrada' (o queda vacío si no lo trae).
+    Si trae 'limites', se aplican los rlimits de CPU y memoria antes de ejecutar;
+    si el script se queda sin memoria el proceso termina con CODIGO_SIN_MEMORIA.
+    Si trae 'perfil', el script corre bajo cProfile y tracemalloc y al terminar
+    (aunque falle) se guardan <perfil>.prof con los tiempos y <perfil>.mem con la memoria.
+    Si trae 'codigo' (marshal en base64, lo envía el grupo de intérpretes), no se compila el script;
+    si el script no compila, se muestra el error y el proceso termina con código 1.
+    """
+    ruta_script = peticion['ruta']
+    # Reproduce el entorno de "python script.py": argv y carpeta del script en sys.path
+    sys.argv = [ruta_script]
+    sys.path[0] = os.path.dirname(ruta_script)
+    if peticion.get('salida'):
+        # Se redirigen los descriptores y no solo sys.stdout, para capturar también a los procesos hijos
+        descriptor = os.open(peticion['salida'], os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        os.dup2(descriptor, 1)
+        os.dup2(descriptor, 2)
+        os.close(descriptor)
+        nulo = os.open(peticion.get('entrada') or os.devnull, os.O_RDONLY)
+        os.dup2(nulo, 0)
+        os.close(nulo)
+    aplicar_limites(peticion.get('limites'))
+    try:
+        if peticion.get('codigo'):
+            codigo = marshal.loads(base64.b64decode(peticion['codigo']))
+        else:
+            try:
+                codigo = obtener_codigo(ruta_script)
+            except (SyntaxError, ValueError, OSError) as e:
+                # Como "python script.py": solo el error, sin las llamadas internas del Dashboard
+                traceback.print_exception(type(e), e, None, chain=False)
+                sys.exit(1)
+        _ejecutar_con_perfil(ruta_script, peticion.get('perfil'), codigo)
+    except MemoryError:
+        traceback.print_exc()
+        sys.exit(CODIGO_SIN_MEMORIA)
+
+
+def _ejecutar_con_perfil(ruta_script, prefijo_perfil, codigo=None):
+    if not prefijo_perfil:
+        ejecutar_modulo(ruta_script, codigo)
+        return
+
+    tracemalloc.start()
+    perfilador = cProfile.Profile()
+    perfilador.enable()
+    try:
+        ejecutar_modulo(ruta_script, codigo)
+    finally:
+        perfilador.disable()
+        instantanea = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        perfilador.dump_stats(prefijo_perfil + '.prof')
+        instantanea.dump(prefijo_perfil + '.mem')
+
+
+_pool = None  # Grupo de intérpretes compartido, se crea la primera vez que se necesita
+
+
+def obtener_pool():
+    global _pool
+    if _pool is None:
+        _pool = PoolInterpretes()
+        atexit.register(_pool.cerrar)  # Cierra los intérpretes en espera al salir del Dashboard
+    return _pool
+
+
+class Trabajo:
+    """
+    Script que se ejecuta en segundo plano.
+
+    Atributos:
+    - numero: Identificador del trabajo dentro del Dashboard.
+    - ruta_script: Ruta del script que se ejecuta.
+    - estado: 'ejecutando', 'terminado', 'error', 'cancelado' o el límite que se superó
+      ('limite_tiempo', 'limite_cpu' o 'limite_memoria').
+    - salida: Últimas líneas de stdout y stderr, ya con su prefijo.
+    """
+
+    def __init__(self, numero, ruta_script):
+        self.numero = numero
+        self.ruta_script = ruta_script
+        self.estado = 'ejecutando'
+        self.codigo_salida = None
+        self.proceso = None  # Proceso de asyncio, disponible en cuanto arranca
+        self.cancelado = False
+        self.excedio_tiempo = False  # True si el vigilante lo detuvo por el límite de tiempo real
+        self.salida = collections.deque(maxlen=LINEAS_POR_TRABAJO)
+
+    def __str__(self):
+        codigo = '' if self.codigo_salida is None else f" (código {self.codigo_salida})"
+        return f"{self.numero} - {os.path.basename(self.ruta_script)} - {self.estado}{codigo}"
+
+
+class GestorTrabajos:
+    """
+    Ejecuta scripts en segundo plano con asyncio mientras el menú sigue respondiendo.
+
+    El bucle de asyncio corre en un hilo propio; el menú le entrega trabajos con
+    run_coroutine_threadsafe. La salida de cada trabajo se guarda con el prefijo
+    [trabajo N | stdout] o [trabajo N | stderr] y se imprime en vivo mientras el
+    usuario está conectado (adjunto) a ese trabajo.
+    """
+
+    def __init__(self, limites=None):
+        self.limites = limites or {}  # Límites de tiempo real, CPU y memoria de cada trabajo
+        self.trabajos = {}  # Diccionario {número: Trabajo}
+        self.siguiente_numero = 1
+        self.adjunto = None  # Número del trabajo cuya salida se muestra en vivo
+        self.bucle = asyncio.new_event_loop()
+        self.hilo = threading.Thread(target=self.bucle.run_forever, daemon=True)
+        self.hilo.start()
+
+    def lanzar(self, ruta_script):
+        """Arranca el script en segundo plano y devuelve su Trabajo."""
+        trabajo = Trabajo(self.siguiente_numero, ruta_script)
+        self.trabajos[trabajo.numero] = trabajo
+        self.siguiente_numero += 1
+        asyncio.run_coroutine_threadsafe(self._ejecutar(trabajo), self.bucle)
+        return trabajo
+
+    async def _ejecutar(self, trabajo):
+        # -u desactiva el búfer de salida para que las líneas lleguen en cuanto se imprimen
+        peticion = json.dumps({'ruta': os.path.abspath(trabajo.ruta_script), 'limites': self.limites})
+        inicio = time.perf_counter()
+        try:
+            trabajo.proceso = await asyncio.create_subprocess_exec(
+                sys.executable, '-u', os.path.abspath(__file__), '--ejecutar', peticion,
+                stdin=subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        except OSError as e:
+            trabajo.estado = 'error'
+            self._agregar_linea(trabajo, 'dashboard', f"No se pudo iniciar el script: {e}")
+            return
+        vigilante = None
+        if self.limites.get('tiempo_real'):  # Detiene el trabajo si supera el tiempo real permitido
+            vigilante = self.bucle.call_later(self.limites['tiempo_real'], self._vencer, trabajo)
+        await asyncio.gather(self._leer(trabajo, trabajo.proceso.stdout, 'stdout'),
+                             self._leer(trabajo, trabajo.proceso.stderr, 'stderr'))
+        trabajo.codigo_salida = await trabajo.proceso.wait()
+        if vigilante:
+            vigilante.cancel()
+        if trabajo.cancelado:
+            resultado = trabajo.estado = 'cancelado'
+        else:
+            resultado = clasificar_resultado(trabajo.codigo_salida, trabajo.excedio_tiempo, self.limites)
+            trabajo.estado = 'terminado' if resultado == 'ok' else resultado
+        registrar_corrida(trabajo.ruta_script, 'segundo_plano', resultado, trabajo.codigo_salida,
+                          time.perf_counter() - inicio)
+        if self.adjunto == trabajo.numero:
+            print(f"[trabajo {trabajo.numero}] {trabajo.estado}")
+
+    def _vencer(self, trabajo):
+        # Llamado por el vigilante cuando el trabajo agota su tiempo real
+        if trabajo.proceso.returncode is None:
+            trabajo.excedio_tiempo = True
+            trabajo.proceso.kill()
+
+    async def _leer(self, trabajo, flujo, nombre):
+        # Lee el flujo línea a línea hasta que el proceso lo cierra
+        while True:
+            linea = await flujo.readline()
+            if not linea:
+                break
+            self._agregar_linea(trabajo, nombre, linea.decode('utf-8', errors='replace').rstrip('\n'))
+
+    def _agregar_linea(self, trabajo, nombre, texto):
+        linea = f"[trabajo {trabajo.numero} | {nombre}] {texto}"
+        trabajo.salida.append(linea)
+        if self.adjunto == trabajo.numero:
+            print(linea, flush=True)
+
+    def adjuntar(self, numero):
+        """Muestra la salida guardada del trabajo y sigue su salida en vivo hasta que el usuario pulse Enter."""
+        trabajo = self.trabajos[numero]
+        for linea in list(trabajo.salida):
+            print(linea)
+        if trabajo.estado != 'ejecutando':
+            print(f"[trabajo {numero}] {trabajo.estado}")
+            return
+        self.adjunto = numero
+        try:
+            input(f"--- Siguiendo el trabajo {numero}; pulsa Enter para volver al menú ---\n")
+        finally:
+            self.adjunto = None
+
+    def cancelar(self, numero):
+        """Termina el trabajo; si no termina en 3 segundos se fuerza su cierre."""
+        trabajo = self.trabajos[numero]
+        if trabajo.estado != 'ejecutando' or trabajo.proceso is None:
+            return False
+        trabajo.cancelado = True
+        asyncio.run_coroutine_threadsafe(self._terminar(trabajo.proceso), self.bucle)
+        return True
+
+    async def _terminar(self, proceso):
+        try:
+            proceso.terminate()
+            await asyncio.wait_for(proceso.wait(), timeout=3)
+        except ProcessLookupError:
+            pass  # El proceso ya había terminado
+        except asyncio.TimeoutError:
+            proceso.kill()
+
+    def en_ejecucion(self):
+        return [trabajo for trabajo in self.trabajos.values() if trabajo.estado == 'ejecutando']
+
+    def cerrar(self):
+        # Al salir del Dashboard se cancelan los trabajos que sigan abiertos (por ejemplo ventanas)
+        futuros = [asyncio.run_coroutine_threadsafe(self._terminar(trabajo.proceso), self.bucle)
+                   for trabajo in self.en_ejecucion() if trabajo.proceso is not None]
+        for futuro in futuros:
+            futuro.result()
+        self.bucle.call_soon_threadsafe(self.bucle.stop)
+
+
+_gestor_trabajos = None  # Gestor de trabajos en segundo plano, se crea la primera vez que se necesita
+
+# Límites de las corridas interactivas y en segundo plano (se configuran con --limite-*)
+limites_sesion = {}
+
+# Si es False, los scripts deterministas se ejecutan siempre (se desactiva con --sin-memo)
+usar_memo = True
+
+# Carpeta de las entradas .stdin de las corridas memorizadas (se configura con --entradas)
+carpeta_entradas_sesion = CARPETA_ENTRADAS
+
+
+def obtener_gestor_trabajos():
+    global _gestor_trabajos
+    if _gestor_trabajos is None:
+        _gestor_trabajos = GestorTrabajos(limites_sesion)
+        atexit.register(_gestor_trabajos.cerrar)  # Cancela los trabajos abiertos al salir del Dashboard
+    return _gestor_trabajos
+
+
+def mostrar_trabajos():
+    # Submenú para listar, seguir o cancelar los trabajos en segundo plano
+    gestor = obtener_gestor_trabajos()
+    while True:
+        print("\nTrabajos en segundo plano")
+        if not gestor.trabajos:
+            print("No hay trabajos. Añade '&' al número de un script para ejecutarlo en segundo plano.")
+        for trabajo in gestor.trabajos.values():
+            print(trabajo)
+        print("a N - Seguir la salida del trabajo N")
+        print("c N - Cancelar el trabajo N")
+        print("0 - Regresar al menú principal")
+
+        eleccion = input("Elige una opción: ").strip().split()
+        if eleccion == ['0']:
+            break
+        try:
+            accion, numero = eleccion[0], int(eleccion[1])
+            if len(eleccion) != 2 or accion not in ('a', 'c') or numero not in gestor.trabajos:
+                raise ValueError
+        except (ValueError, IndexError):
+            print("Opción no válida. Por favor, intenta de nuevo.")
+            continue
+        if accion == 'a':
+            gestor.adjuntar(numero)
+        elif gestor.cancelar(numero):
+            print(f"Cancelando el trabajo {numero}...")
+        else:
+            print(f"El trabajo {numero} ya no está en ejecución.")
+
+
+def _comando_python():
+    # Ejecuta el script usando python en Windows y python3 en sistemas basados en Unix
+    return 'python' if os.name == 'nt' else 'python3'
+
+
+def ruta_datos(*partes):
+    """Devuelve una ruta dentro de la carpeta de datos del Dashboard, creando la carpeta que la contiene."""
+    ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), CARPETA_DATOS, *partes)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    return ruta
+
+
+def guardar_json(ruta, datos):
+    # Escribe en un archivo temporal y lo renombra, para no dejar nunca un JSON a medias
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo, ensure_ascii=False, sort_keys=True)
+    os.replace(temporal, ruta)
+
+
+def cargar_json(ruta, por_defecto):
+    # Lee un JSON del Dashboard; si falta o está dañado se empieza de nuevo
+    try:
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return por_defecto
+
+
+def _escanear_carpeta(ruta_carpeta, es_raiz):
+    # Lista los scripts .py y las subcarpetas de una sola carpeta
+    scripts, subcarpetas = [], []
+    for entrada in os.scandir(ruta_carpeta):
+        if entrada.is_dir():
+            if es_raiz:  # En la raíz solo interesan las carpetas de las semanas
+                if PATRON_UNIDAD.fullmatch(entrada.name):
+                    subcarpetas.append(entrada.name)
+            elif not entrada.name.startswith('.') and entrada.name != '__pycache__':
+                subcarpetas.append(entrada.name)
+        elif entrada.is_file() and entrada.name.endswith('.py') and not es_raiz:
+            scripts.append(entrada.name)
+    return {'scripts': sorted(scripts), 'subcarpetas': sorted(subcarpetas)}
+
+
+def actualizar_catalogo(ruta_base):
+    """
+    Devuelve el catálogo de scripts de todas las semanas, recorriendo las subcarpetas.
+
+    El catálogo se guarda en disco junto con la fecha de modificación (mtime) de cada carpeta;
+    solo se vuelven a escanear las carpetas cuyo mtime cambió desde la última vez.
+    El resultado es un diccionario {unidad: [rutas de scripts relativas a la unidad]}.
+    """
+    ruta_catalogo = ruta_datos('catalogo.json')
+    anterior = cargar_json(ruta_catalogo, {}).get('carpetas', {})
+    carpetas = {}  # Catálogo actualizado: {carpeta relativa: {mtime_ns, scripts, subcarpetas}}
+    pendientes = ['.']
+    while pendientes:
+        relativa = pendientes.pop()
+        try:
+            mtime_ns = os.stat(os.path.join(ruta_base, relativa)).st_mtime_ns
+        except FileNotFoundError:
+            continue  # La carpeta se borró mientras se recorría el árbol
+        entrada = anterior.get(relativa)
+        if entrada is None or entrada['mtime_ns'] != mtime_ns:  # Carpeta nueva o modificada
+            entrada = _escanear_carpeta(os.path.join(ruta_base, relativa), relativa == '.')
+            entrada['mtime_ns'] = mtime_ns
+        carpetas[relativa] = entrada
+        pendientes.extend(os.path.normpath(os.path.join(relativa, sub)) for sub in entrada['subcarpetas'])
+
+    if carpetas != anterior:  # Solo se reescribe el catálogo si algo cambió
+        guardar_json(ruta_catalogo, {'carpetas': carpetas})
+
+    catalogo = {unidad: [] for unidad in carpetas['.']['subcarpetas']}
+    for relativa, entrada in carpetas.items():
+        if relativa != '.':
+            unidad = relativa.split(os.sep, 1)[0]  # La unidad es el primer componente de la ruta
+            catalogo[unidad].extend(os.path.relpath(os.path.join(relativa, nombre), unidad) for nombre in entrada['scripts'])
+    for scripts in catalogo.values():
+        scripts.sort()
+    return catalogo
+
+
+def ordenar_unidades(catalogo):
+    # Ordena las semanas por su número ("Semana 9" antes que "Semana 10")
+    return sorted(catalogo, key=lambda unidad: int(PATRON_UNIDAD.fullmatch(unidad).group(1)))
+
+
+def extraer_simbolos(fuente):
+    """
+    Devuelve las clases, funciones y métodos definidos en el código fuente.
+
+    Cada símbolo es una lista [nombre calificado, tipo, línea]; el nombre calificado incluye
+    las clases que lo contienen (por ejemplo "Inventario.guardar_inventario").
+    """
+    simbolos = []
+    pendientes = [(nodo, '', False) for nodo in ast.parse(fuente).body]  # (nodo, prefijo, dentro de clase)
+    while pendientes:
+        nodo, prefijo, en_clase = pendientes.pop()
+        if isinstance(nodo, ast.ClassDef):
+            tipo = 'clase'
+        elif isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            tipo = 'método' if en_clase else 'función'
+        else:
+            # Las definiciones pueden estar dentro de if, try, with, ...
+            pendientes.extend((hijo, prefijo, en_clase) for hijo in ast.iter_child_nodes(nodo)
+                              if isinstance(hijo, ast.stmt))
+            continue
+        calificado = prefijo + nodo.name
+        simbolos.append([calificado, tipo, nodo.lineno])
+        pendientes.extend((hijo, calificado + '.', tipo == 'clase') for hijo in nodo.body)
+    return sorted(simbolos, key=lambda simbolo: simbolo[2])
+
+
+def _claves_simbolo(calificado):
+    # Un símbolo se encuentra por su nombre simple y por su nombre calificado, sin distinguir mayúsculas
+    claves = {calificado.lower(), calificado.rsplit('.', 1)[-1].lower()}
+    return sorted(claves)
+
+
+_simbolos_en_memoria = None  # Índice de símbolos ya leído en esta sesión del Dashboard
+
+
+def actualizar_indice_simbolos(ruta_base):
+    """
+    Devuelve el índice invertido de símbolos de todos los scripts del catálogo.
+
+    El índice se guarda en .dashboard/simbolos.json con el hash SHA-256 de cada archivo. Solo se
+    vuelven a analizar con ast los archivos cuyo hash cambió; el hash solo se recalcula si
+    cambiaron su mtime o su tamaño. El índice invertido tiene la forma
+    {clave en minúsculas: [[script, nombre calificado, tipo, línea], ...]}.
+    """
+    global _simbolos_en_memoria
+    ruta_indice = ruta_datos('simbolos.json')
+    if _simbolos_en_memoria is None:  # El archivo solo se lee la primera vez
+        _simbolos_en_memoria = cargar_json(ruta_indice, {})
+    guardado = _simbolos_en_memoria
+    archivos = guardado.get('archivos', {})  # {script: {mtime_ns, tamano, hash, simbolos}}
+    invertido = guardado.get('invertido', {})
+    catalogo = actualizar_catalogo(ruta_base)
+    actuales = {os.path.join(unidad, script).replace(os.sep, '/') for unidad in catalogo for script in catalogo[unidad]}
+    cambios = False
+
+    def quitar(script):
+        # Retira del índice invertido los símbolos que tenía el archivo
+        for calificado, _, _ in archivos.pop(script)['simbolos']:
+            for clave in _claves_simbolo(calificado):
+                restantes = [entrada for entrada in invertido.get(clave, []) if entrada[0] != script]
+                if restantes:
+                    invertido[clave] = restantes
+                else:
+                    invertido.pop(clave, None)
+
+    for script in set(archivos) - actuales:  # Scripts borrados o movidos
+        quitar(script)
+        cambios = True
+
+    for script in sorted(actuales):
+        ruta_script = os.path.join(ruta_base, script)
+        estado = os.stat(ruta_script)
+        entrada = archivos.get(script)
+        if entrada and (entrada['mtime_ns'], entrada['tamano']) == (estado.st_mtime_ns, estado.st_size):
+            continue  # Sin cambios: ni siquiera se lee el archivo
+        with open(ruta_script, 'rb') as archivo:
+            fuente = archivo.read()
+        huella = hashlib.sha256(fuente).hexdigest()
+        if entrada and entrada['hash'] == huella:  # Solo cambió la fecha: se conservan los símbolos
+            entrada['mtime_ns'], entrada['tamano'] = estado.st_mtime_ns, estado.st_size
+            cambios = True
+            continue
+        if entrada:
+            quitar(script)
+        try:
+            simbolos = extraer_simbolos(fuente)
+        except SyntaxError:
+            simbolos = []  # Un script con errores de sintaxis no aporta símbolos
+        archivos[script] = {'mtime_ns': estado.st_mtime_ns, 'tamano': estado.st_size, 'hash': huella,
+                            'simbolos': simbolos}
+        for calificado, tipo, linea in simbolos:
+            for clave in _claves_simbolo(calificado):
+                invertido.setdefault(clave, []).append([script, calificado, tipo, linea])
+        cambios = True
+
+    if cambios:
+        _simbolos_en_memoria = {'archivos': archivos, 'invertido': invertido}
+        guardar_json(ruta_indice, _simbolos_en_memoria)
+    return invertido
+
+
+def buscar_simbolo(invertido, consulta):
+    """
+    Busca una clase, función o método en el índice invertido.
+
+    Primero busca la clave exacta (nombre simple o calificado); si no hay resultados,
+    devuelve los símbolos cuyo nombre contiene la consulta.
+    """
+    consulta = consulta.strip().lower()
+    if not consulta:
+        return []
+    resultados = list(invertido.get(consulta, []))
+    if not resultados:
+        for clave, entradas in invertido.items():
+            if consulta in clave:
+                resultados.extend(entradas)
+    # Un símbolo aparece bajo dos claves (simple y calificada): se eliminan los repetidos
+    unicos = {(script, calificado, tipo, linea) for script, calificado, tipo, linea in resultados}
+    return sorted(unicos)
+
+
+def mostrar_busqueda_simbolos(ruta_base):
+    # Pide un nombre y muestra dónde está definido en todas las semanas
+    consulta = input("Nombre de la clase, función o método a buscar: ")
+    inicio = time.perf_counter()
+    invertido = actualizar_indice_simbolos(ruta_base)
+    resultados = buscar_simbolo(invertido, consulta)
+    duracion = (time.perf_counter() - inicio) * 1000
+    if not resultados:
+        print(f"No se encontró '{consulta}' ({duracion:.1f} ms).")
+        return
+    print(f"\n{len(resultados)} resultado(s) en {duracion:.1f} ms:")
+    for script, calificado, tipo, linea in resultados:
+        print(f"{calificado} ({tipo}) - {script}:{linea}")
+
+# Índices de líneas ya construidos: {ruta absoluta: ((mtime_ns, tamaño), desplazamientos)}
+_indices_lineas = {}
+
+
+def indice_lineas(ruta_script_absoluta, mapa):
+    """
+    Devuelve los desplazamientos en bytes del inicio de cada línea del archivo mapeado.
+
+    La línea i ocupa mapa[desplazamientos[i]:desplazamientos[i + 1]]. El índice se construye
+    una sola vez por archivo y se reutiliza mientras no cambien su mtime ni su tamaño.
+    """
+    estado = os.stat(ruta_script_absoluta)
+    version = (estado.st_mtime_ns, estado.st_size)
+    guardado = _indices_lineas.get(ruta_script_absoluta)
+    if guardado and guardado[0] == version:
+        return guardado[1]
+
+    desplazamientos = array('q', [0])
+    posicion = mapa.find(b'\n')
+    while posicion != -1:
+        desplazamientos.append(posicion + 1)
+        posicion = mapa.find(b'\n', posicion + 1)
+    if desplazamientos[-1] != len(mapa):  # La última línea no termina en salto de línea
+        desplazamientos.append(len(mapa))
+    _indices_lineas[ruta_script_absoluta] = (version, desplazamientos)
+    return desplazamientos
+
+
+def mostrar_pagina(ruta_script, mapa, desplazamientos, pagina):
+    # Muestra solo las líneas de la página pedida: se copian únicamente sus bytes del mapa
+    total_lineas = len(desplazamientos) - 1
+    primera = pagina * LINEAS_POR_PAGINA
+    ultima = min(primera + LINEAS_POR_PAGINA, total_lineas)
+    print(f"\n--- Código de {ruta_script} (líneas {primera + 1}-{ultima} de {total_lineas}) ---\n")
+    print(mapa[desplazamientos[primera]:desplazamientos[ultima]].decode('utf-8', errors='replace'), end='')
+
 
 def mostrar_codigo(ruta_script):
     # Asegúrate de que la ruta al script es absoluta
     ruta_script_absoluta = os.path.abspath(ruta_script)  # Convierte la ruta del script a una ruta absoluta
     try:
-        with open(ruta_script_absoluta, 'r') as archivo:  # Intenta abrir el archivo en modo lectura
-            codigo = archivo.read()  # Lee el contenido del archivo
-            print(f"\n--- Código de {ruta_script} ---\n")  # Imprime un encabezado con el nombre del script
-            print(codigo)  # Imprime el código del script
-            return codigo  # Devuelve el código leído
+        with open(ruta_script_absoluta, 'rb') as archivo:  # Intenta abrir el archivo en modo lectura
+            if os.fstat(archivo.fileno()).st_size == 0:  # mmap no admite archivos vacíos
+                return None  # Un archivo vacío no tiene código que mostrar ni ejecutar
+            with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                desplazamientos = indice_lineas(ruta_script_absoluta, mapa)
+                paginas = (len(desplazamientos) - 2) // LINEAS_POR_PAGINA + 1
+                pagina = 0
+                while True:  # Bucle del visor: una página por vuelta
+                    mostrar_pagina(ruta_script, mapa, desplazamientos, pagina)
+                    if paginas == 1:
+                        break  # Todo el código cabe en una página
+                    orden = input(f"\n[Página {pagina + 1}/{paginas}] Enter: siguiente, 'a': anterior, "
+                                  f"número: ir a la página, 'q': terminar de ver: ").strip().lower()
+                    if orden == 'q':
+                        break
+                    elif orden == 'a':
+                        pagina = max(pagina - 1, 0)
+                    elif orden.isdigit() and 1 <= int(orden) <= paginas:
+                        pagina = int(orden) - 1
+                    elif orden == '':
+                        if pagina == paginas - 1:
+                            break  # Enter en la última página termina el visor
+                        pagina += 1
+                    else:
+                        print("Opción no válida. Por favor, intenta de nuevo.")
+                return True  # Indica que el archivo tiene código
     except FileNotFoundError:
         print("El archivo no se encontró.")  # Maneja el caso en que el archivo no existe
         return None  # Devuelve None si no se encuentra el archivo
@@ -17,48 +872,287 @@ def mostrar_codigo(ruta_script):
         print(f"Ocurrió un error al leer el archivo: {e}")  # Maneja cualquier otro error que ocurra
         return None  # Devuelve None en caso de error
 
-def ejecutar_codigo(ruta_script):
+def es_determinista(fuente, carpeta_script=None):
+    """
+    Indica si la salida del script depende solo de su código.
+
+    Se considera determinista si no importa módulos de MODULOS_NO_DETERMINISTAS ni llama
+    a input, open, id o hash. Tampoco si importa un módulo de su propia carpeta
+    (carpeta_script): la clave de la memoria solo cubre el código del script, y un cambio
+    en ese módulo repetiría una salida vieja. Es una aproximación: ante la duda, usa --sin-memo.
+    """
+    try:
+        arbol = ast.parse(fuente)
+    except SyntaxError:
+        return False
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            modulos = [alias.name for alias in nodo.names]
+        elif isinstance(nodo, ast.ImportFrom):
+            modulos = [nodo.module or '']
+        elif isinstance(nodo, ast.Call) and isinstance(nodo.func, ast.Name):
+            if nodo.func.id in FUNCIONES_NO_DETERMINISTAS:
+                return False
+            continue
+        else:
+            continue
+        if any(modulo.split('.')[0] in MODULOS_NO_DETERMINISTAS for modulo in modulos):
+            return False
+        if carpeta_script and any(es_modulo_local(carpeta_script, modulo.split('.')[0]) for modulo in modulos):
+            return False
+    return True
+
+
+def es_modulo_local(carpeta_script, nombre):
+    # El script corre con su carpeta en sys.path[0], así que un módulo o paquete de ahí tiene prioridad
+    return bool(nombre) and (os.path.isfile(os.path.join(carpeta_script, nombre + '.py'))
+                             or os.path.isdir(os.path.join(carpeta_script, nombre)))
+
+
+def ruta_entrada(ruta_script, carpeta_entradas=CARPETA_ENTRADAS):
+    """Devuelve la ruta de la entrada .stdin del script (<carpeta_entradas>/<ruta del script>.stdin) o None."""
+    ruta_base = os.path.dirname(os.path.abspath(__file__))
+    relativa = os.path.relpath(os.path.abspath(ruta_script), ruta_base)
+    ruta = os.path.join(ruta_base, carpeta_entradas, os.path.splitext(relativa)[0] + '.stdin')
+    return ruta if os.path.isfile(ruta) else None
+
+
+def clave_memo(fuente, entrada=b''):
+    # La salida memorizada depende del código, del intérprete que lo ejecuta y de lo que recibe por stdin
+    huella = hashlib.sha256(fuente)
+    huella.update(b'\0' + sys.version.encode('utf-8') + b'\0' + sys.executable.encode('utf-8') + b'\0')
+    huella.update(hashlib.sha256(entrada).digest())
+    return huella.hexdigest()
+
+
+def leer_memo(clave):
+    """Devuelve la salida memorizada para la clave (y la marca como la más reciente) o None."""
+    ruta_indice = ruta_datos('memo', 'indice.json')
+    orden = cargar_json(ruta_indice, [])  # Claves de la menos a la más recientemente usada
+    if clave not in orden:
+        return None
     try:
-        if os.name == 'nt':  # Verifica si el sistema operativo es Windows
-            subprocess.run(['python', ruta_script], check=True)  # Ejecuta el script usando python en Windows
+        with open(ruta_datos('memo', clave + '.salida'), 'rb') as archivo:
+            salida = archivo.read()
+    except FileNotFoundError:
+        return None
+    orden.remove(clave)
+    orden.append(clave)
+    guardar_json(ruta_indice, orden)
+    return salida
+
+
+def guardar_memo(clave, salida):
+    # Guarda la salida y descarta las menos usadas si se pasa de MEMO_MAX_ENTRADAS
+    ruta_indice = ruta_datos('memo', 'indice.json')
+    orden = [otra for otra in cargar_json(ruta_indice, []) if otra != clave]
+    with open(ruta_datos('memo', clave + '.salida'), 'wb') as archivo:
+        archivo.write(salida)
+    orden.append(clave)
+    while len(orden) > MEMO_MAX_ENTRADAS:
+        descartada = orden.pop(0)
+        try:
+            os.remove(ruta_datos('memo', descartada + '.salida'))
+        except FileNotFoundError:
+            pass
+    guardar_json(ruta_indice, orden)
+
+
+def carpeta_perfiles(ruta_script):
+    # Cada script guarda sus corridas perfiladas en una carpeta propia dentro de .dashboard/perfiles
+    ruta_base = os.path.dirname(os.path.abspath(__file__))
+    relativa = os.path.splitext(os.path.relpath(os.path.abspath(ruta_script), ruta_base))[0]
+    carpeta = ruta_datos('perfiles', relativa.replace(os.sep, '__'))
+    os.makedirs(carpeta, exist_ok=True)
+    return carpeta
+
+
+def corridas_perfiladas(ruta_script):
+    """Devuelve los nombres de las corridas perfiladas del script, de la más antigua a la más reciente."""
+    carpeta = carpeta_perfiles(ruta_script)
+    return sorted(os.path.splitext(nombre)[0] for nombre in os.listdir(carpeta) if nombre.endswith('.prof'))
+
+
+def _filtrar_instantanea(instantanea):
+    # Descarta la memoria del propio mecanismo de importación y de tracemalloc
+    return instantanea.filter_traces((
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ))
+
+
+def mostrar_perfil(prefijo):
+    # Resumen de una corrida: funciones con más tiempo acumulado y líneas que más memoria reservan
+    print(f"\n--- Perfil {os.path.basename(prefijo)}: funciones con más tiempo acumulado ---")
+    pstats.Stats(prefijo + '.prof').strip_dirs().sort_stats('cumulative').print_stats(TOP_PERFIL)
+    print(f"--- Perfil {os.path.basename(prefijo)}: líneas que más memoria reservan ---")
+    instantanea = _filtrar_instantanea(tracemalloc.Snapshot.load(prefijo + '.mem'))
+    for estadistica in instantanea.statistics('lineno')[:TOP_PERFIL]:
+        print(estadistica)
+
+
+def comparar_perfiles(ruta_script, corrida_a, corrida_b):
+    """Muestra las diferencias de tiempo y de memoria entre dos corridas perfiladas del script."""
+    carpeta = carpeta_perfiles(ruta_script)
+    prefijo_a, prefijo_b = os.path.join(carpeta, corrida_a), os.path.join(carpeta, corrida_b)
+    stats_a = pstats.Stats(prefijo_a + '.prof').strip_dirs().stats
+    stats_b = pstats.Stats(prefijo_b + '.prof').strip_dirs().stats
+    # stats: {(archivo, línea, función): (llamadas primitivas, llamadas, tiempo propio, tiempo acumulado, llamadores)}
+    total_a = sum(datos[2] for datos in stats_a.values())
+    total_b = sum(datos[2] for datos in stats_b.values())
+    print(f"\n--- Comparación {corrida_a} -> {corrida_b} ---")
+    print(f"Tiempo total: {total_a:.6f} s -> {total_b:.6f} s ({total_b - total_a:+.6f} s)")
+
+    diferencias = []
+    for funcion in stats_a.keys() | stats_b.keys():
+        _, llamadas_a, _, acumulado_a, _ = stats_a.get(funcion, (0, 0, 0.0, 0.0, {}))
+        _, llamadas_b, _, acumulado_b, _ = stats_b.get(funcion, (0, 0, 0.0, 0.0, {}))
+        diferencias.append((acumulado_b - acumulado_a, funcion, llamadas_a, llamadas_b, acumulado_a, acumulado_b))
+    diferencias.sort(key=lambda diferencia: abs(diferencia[0]), reverse=True)
+    print("Funciones con más cambio en tiempo acumulado:")
+    for cambio, (archivo, linea, nombre), llamadas_a, llamadas_b, acumulado_a, acumulado_b in diferencias[:TOP_PERFIL]:
+        print(f"  {cambio:+.6f} s  {acumulado_a:.6f} -> {acumulado_b:.6f} s  "
+              f"llamadas {llamadas_a} -> {llamadas_b}  {nombre} ({archivo}:{linea})")
+
+    print("Líneas con más cambio en memoria reservada:")
+    instantanea_a = _filtrar_instantanea(tracemalloc.Snapshot.load(prefijo_a + '.mem'))
+    instantanea_b = _filtrar_instantanea(tracemalloc.Snapshot.load(prefijo_b + '.mem'))
+    for estadistica in instantanea_b.compare_to(instantanea_a, 'lineno')[:TOP_PERFIL]:
+        print(f"  {estadistica}")
+
+
+def elegir_y_comparar_perfiles(ruta_script):
+    # Lista las corridas guardadas del script y pide las dos que se van a comparar
+    corridas = corridas_perfiladas(ruta_script)
+    if len(corridas) < 2:
+        print("Se necesitan al menos dos corridas perfiladas de este script para compararlas.")
+        return
+    for i, corrida in enumerate(corridas, start=1):
+        print(f"{i} - {corrida}")
+    try:
+        a = input(f"Corrida base (Enter = {len(corridas) - 1}): ").strip()
+        b = input(f"Corrida a comparar (Enter = {len(corridas)}): ").strip()
+        a = int(a) - 1 if a else len(corridas) - 2
+        b = int(b) - 1 if b else len(corridas) - 1
+        if not (0 <= a < len(corridas) and 0 <= b < len(corridas)):
+            raise ValueError
+    except ValueError:
+        print("Opción no válida. Por favor, intenta de nuevo.")
+        return
+    comparar_perfiles(ruta_script, corridas[a], corridas[b])
+
+
+def ejecutar_codigo(ruta_script, perfilar=False):
+    # Con perfilar=True el script corre bajo cProfile y tracemalloc y la corrida queda guardada
+    opciones = {}
+    clave = None
+    if usar_memo and not perfilar:
+        with open(ruta_script, 'rb') as archivo:
+            fuente = archivo.read()
+        if es_determinista(fuente, os.path.dirname(os.path.abspath(ruta_script))):
+            # Si hay entrada .stdin, el script la recibe y forma parte de la clave
+            ruta_stdin = ruta_entrada(ruta_script, carpeta_entradas_sesion)
+            entrada = b''
+            if ruta_stdin:
+                with open(ruta_stdin, 'rb') as archivo:
+                    entrada = archivo.read()
+                opciones['entrada'] = ruta_stdin
+            clave = clave_memo(fuente, entrada)
+            salida = leer_memo(clave)
+            if salida is not None:  # Misma fuente, mismo intérprete, misma entrada: misma salida
+                sys.stdout.flush()
+                sys.stdout.buffer.write(salida)
+                sys.stdout.flush()
+                print("(salida memorizada; usa --sin-memo para ejecutar siempre el script)")
+                registrar_corrida(ruta_script, 'memorizado', 'ok', 0, 0.0)
+                return
+            # Sin entrada en la memoria: se ejecuta capturando stdout y stderr en un archivo
+            descriptor, opciones['salida'] = tempfile.mkstemp(suffix='.salida')
+            os.close(descriptor)
+    if perfilar:
+        fecha = time.strftime('%Y%m%d-%H%M%S')  # Las corridas se nombran por fecha y hora
+        anteriores = set(corridas_perfiladas(ruta_script))
+        corrida, sufijo = fecha, 2
+        while corrida in anteriores:  # Dos corridas en el mismo segundo
+            corrida, sufijo = f"{fecha}-{sufijo}", sufijo + 1
+        opciones['perfil'] = os.path.join(carpeta_perfiles(ruta_script), corrida)
+    if limites_sesion:
+        opciones['limites'] = limites_sesion
+    inicio = time.perf_counter()
+    codigo_salida, excedio_tiempo = None, False
+    try:
+        if os.name == 'nt':  # Windows no permite heredar el canal de órdenes (pass_fds)
+            if opciones:  # El perfilado, los límites y la captura necesitan el ejecutor del Dashboard
+                peticion = json.dumps(dict(opciones, ruta=os.path.abspath(ruta_script)))
+                comando = [_comando_python(), os.path.abspath(__file__), '--ejecutar', peticion]
+            else:
+                comando = [_comando_python(), ruta_script]  # Arranca un intérprete nuevo
+            try:
+                codigo_salida = subprocess.run(comando, timeout=limites_sesion.get('tiempo_real')).returncode
+            except subprocess.TimeoutExpired:
+                excedio_tiempo = True
         else:  # Para sistemas basados en Unix
-            subprocess.run(['python3', ruta_script], check=True)  # Ejecuta el script usando python3
+            # Usa un intérprete ya arrancado del grupo
+            codigo_salida, excedio_tiempo = obtener_pool().ejecutar(
+                ruta_script, tiempo_real=limites_sesion.get('tiempo_real'), **opciones)
     except Exception as e:
         print(f"Ocurrió un error al ejecutar el código: {e}")  # Maneja cualquier error que ocurra al ejecutar el script
+    else:
+        resultado = clasificar_resultado(codigo_salida, excedio_tiempo, limites_sesion)
+        if clave:  # Muestra la salida capturada y la memoriza si la corrida terminó bien
+            with open(opciones['salida'], 'rb') as archivo:
+                salida = archivo.read()
+            sys.stdout.flush()
+            sys.stdout.buffer.write(salida)
+            sys.stdout.flush()
+            if resultado == 'ok':
+                guardar_memo(clave, salida)
+        if resultado != 'ok':
+            print(MENSAJES_RESULTADO[resultado].format(codigo=codigo_salida))
+        registrar_corrida(ruta_script, 'interactivo', resultado, codigo_salida, time.perf_counter() - inicio)
+    finally:
+        if clave:
+            os.remove(opciones['salida'])
+    if perfilar and os.path.exists(opciones['perfil'] + '.prof'):
+        mostrar_perfil(opciones['perfil'])
 
 def mostrar_menu():
     # Define la ruta base donde se encuentra el dashboard.py
-    ruta_base = os.path.dirname(__file__)  # Obtiene la ruta del directorio donde se encuentra este archivo
-
-    # Diccionario que mapea números a nombres de semanas
-    unidades = {
-        '1': 'Semana 2',
-        '2': 'Semana 3',
-        '3': 'Semana 4',
-        '4': 'Semana 5',
-        '5': 'Semana 6',
-        '6': 'Semana 7'
-    }
+    ruta_base = os.path.dirname(os.path.abspath(__file__))  # Obtiene la ruta del directorio donde se encuentra este archivo
 
     while True:  # Bucle infinito para mostrar el menú
+        # El catálogo se revisa en cada vuelta: solo se escanean las carpetas que cambiaron
+        catalogo = actualizar_catalogo(ruta_base)
+        # Diccionario que mapea números a nombres de semanas
+        unidades = {str(i): unidad for i, unidad in enumerate(ordenar_unidades(catalogo), start=1)}
+
         print("\nMenu Principal - Dashboard")  # Imprime el encabezado del menú principal
         # Imprime las opciones del menú principal
         for key in unidades:
             print(f"{key} - {unidades[key]}")  # Imprime cada opción de unidad
+        print("b - Buscar una clase, función o método")  # Opción para buscar en el índice de símbolos
+        print("t - Trabajos en segundo plano")  # Opción para gestionar los scripts lanzados con '&'
         print("0 - Salir")  # Opción para salir del programa
 
         eleccion_unidad = input("Elige una unidad o '0' para salir: ")  # Solicita al usuario que elija una unidad
         if eleccion_unidad == '0':  # Si el usuario elige salir
+            if _gestor_trabajos and _gestor_trabajos.en_ejecucion():
+                print(f"Cancelando {len(_gestor_trabajos.en_ejecucion())} trabajo(s) en segundo plano.")
             print("Saliendo del programa.")  # Imprime mensaje de salida
             break  # Sale del bucle
+        elif eleccion_unidad == 'b':  # Si el usuario quiere buscar un símbolo
+            mostrar_busqueda_simbolos(ruta_base)
+        elif eleccion_unidad == 't':  # Si el usuario quiere ver los trabajos en segundo plano
+            mostrar_trabajos()
         elif eleccion_unidad in unidades:  # Si la elección es válida
-            mostrar_scripts(os.path.join(ruta_base, unidades[eleccion_unidad]))  # Muestra los scripts de la unidad seleccionada
+            unidad = unidades[eleccion_unidad]
+            mostrar_scripts(os.path.join(ruta_base, unidad), catalogo[unidad])  # Muestra los scripts de la unidad seleccionada
         else:
             print("Opción no válida. Por favor, intenta de nuevo.")  # Mensaje de error si la opción no es válida
 
-def mostrar_scripts(ruta_unidad):
-    # Obtiene una lista de scripts Python en la ruta de la unidad
-    scripts = [f.name for f in os.scandir(ruta_unidad) if f.is_file() and f.name.endswith('.py')]  # Filtra los archivos .py
+def mostrar_scripts(ruta_unidad, scripts):
+    # scripts: rutas de los scripts Python relativas a la unidad, tomadas del catálogo
 
     while True:  # Bucle infinito para mostrar los scripts
         print("\nScripts - Selecciona un script para ver y ejecutar")  # Imprime el encabezado de scripts
@@ -67,23 +1161,260 @@ def mostrar_scripts(ruta_unidad):
             print(f"{i} - {script}")  # Imprime cada script con su número correspondiente
         print("0 - Regresar al menú principal")  # Opción para regresar al menú principal
 
+        print("Añade '!' al número (por ejemplo 2!) para ejecutar el script sin ver su código, "
+              "'&' para ejecutarlo en segundo plano, 'p' para ejecutarlo perfilado "
+              "o 'c' para comparar sus corridas perfiladas")
+
         eleccion_script = input("Elige un script o '0' para regresar: ")  # Solicita al usuario que elija un script
         if eleccion_script == '0':  # Si el usuario elige regresar
             break  # Sale del bucle
         else:
             try:
-                eleccion_script = int(eleccion_script) - 1  # Convierte la elección a un índice (restando 1)
+                sufijo = eleccion_script[-1:] if eleccion_script[-1:] in ('!', '&', 'p', 'c') else ''  # Modo elegido
+                eleccion_script = int(eleccion_script[:len(eleccion_script) - len(sufijo)]) - 1  # Convierte la elección a un índice (restando 1)
                 if  0 <= eleccion_script < len(scripts):  # Verifica si la elección está dentro del rango de scripts
                     ruta_script = os.path.join(ruta_unidad, scripts[eleccion_script])  # Construye la ruta del script seleccionado
-                    codigo = mostrar_codigo(ruta_script)  # Muestra el código del script
+                    if sufijo == 'c':  # Compara dos corridas perfiladas en lugar de ejecutar
+                        elegir_y_comparar_perfiles(ruta_script)
+                        continue
+                    if sufijo == '&':  # Lanza el script en segundo plano y vuelve a la lista
+                        trabajo = obtener_gestor_trabajos().lanzar(ruta_script)
+                        print(f"Trabajo {trabajo.numero} iniciado en segundo plano (opción 't' del menú principal).")
+                        continue
+                    # Muestra el código del script, o solo comprueba que tenga código si se pidió omitirlo
+                    codigo = mostrar_codigo(ruta_script) if sufijo == '' else os.path.getsize(ruta_script) > 0
                     if codigo:  # Si se obtuvo código
                         print("Ejecutando el script...\n")  # Imprime mensaje de ejecución
-                        ejecutar_codigo(ruta_script)  # Ejecuta el script
+                        ejecutar_codigo(ruta_script, perfilar=(sufijo == 'p'))  # Ejecuta el script
                 else:
                     print("Opción no válida. Por favor, intenta de nuevo.")  # Mensaje de error si la opción no es válida
             except ValueError:  # Captura errores de conversión de tipo
                 print("Opción no válida. Por favor, intenta de nuevo.")  # Mensaje de error si la entrada no es un número
 
+def _ejecutar_en_lote(ruta_script, ruta_entrada, limites):
+    """
+    Ejecuta un script sin interacción y devuelve sus métricas.
+
+    El script corre en una carpeta temporal con copia de los archivos de datos de su carpeta,
+    así los inventarios y bibliotecas del repositorio no se modifican y cada corrida es repetible.
+    Los límites de CPU y memoria se aplican con rlimits en el proceso hijo; el de tiempo real,
+    con un vigilante que detiene el proceso cuando vence. El pico de memoria lo anota el propio
+    script al salir (LANZADOR_LOTE); si el proceso fue detenido antes, queda en None.
+    """
+    carpeta_script = os.path.dirname(ruta_script)
+    with tempfile.TemporaryDirectory() as carpeta_trabajo:
+        for entrada in os.scandir(carpeta_script):
+            if entrada.is_file() and not entrada.name.endswith('.py'):
+                shutil.copy(entrada.path, carpeta_trabajo)  # Copia inventario.txt, biblioteca.json, ...
+        stdin = open(ruta_entrada, 'rb') if ruta_entrada else subprocess.DEVNULL
+        ruta_memoria = os.path.join(carpeta_trabajo, '.memoria-dashboard')
+        # stderr va a un archivo de la carpeta temporal para reconocer los MemoryError
+        with open(os.path.join(carpeta_trabajo, '.stderr-dashboard'), 'w+b') as stderr:
+            try:
+                inicio = time.perf_counter()
+                proceso = subprocess.Popen([sys.executable, '-c', LANZADOR_LOTE, ruta_script, ruta_memoria],
+                                           cwd=carpeta_trabajo, stdin=stdin,
+                                           stdout=subprocess.DEVNULL, stderr=stderr,
+                                           preexec_fn=lambda: aplicar_limites(limites))
+                vencido = threading.Event()
+                terminado = threading.Event()
+                cerrojo = threading.Lock()
+
+                def vencer():
+                    # Con el cerrojo, el proceso no puede recogerse en el medio: su pid sigue siendo suyo
+                    with cerrojo:
+                        if terminado.is_set() or os.waitid(os.P_PID, proceso.pid,
+                                                           os.WEXITED | os.WNOHANG | os.WNOWAIT):
+                            return  # Terminó por sí solo antes de vencer el plazo
+                        vencido.set()
+                        proceso.kill()
+
+                vigilante = threading.Timer(limites['tiempo_real'], vencer)
+                vigilante.start()
+                # WNOWAIT espera a que termine sin recogerlo, así su pid no se reutiliza mientras
+                # el vigilante todavía puede enviarle la señal
+                os.waitid(os.P_PID, proceso.pid, os.WEXITED | os.WNOWAIT)
+                tiempo_real = time.perf_counter() - inicio
+                with cerrojo:
+                    terminado.set()
+                vigilante.cancel()
+                # wait4 lo recoge y devuelve el uso de recursos de este proceso hijo en concreto
+                _, estado, uso = os.wait4(proceso.pid, 0)
+            finally:
+                if ruta_entrada:
+                    stdin.close()
+            stderr.seek(0)
+            salida_error = stderr.read()[-4096:].decode('utf-8', errors='replace')  # Basta con el final
+        try:
+            with open(ruta_memoria) as archivo:
+                rss_max_kb = int(archivo.read())
+        except (FileNotFoundError, ValueError):  # Detenido por una señal antes de anotarlo
+            rss_max_kb = None
+    codigo_salida = os.waitstatus_to_exitcode(estado)
+    return {
+        'estado': codigo_salida,
+        'resultado': clasificar_resultado(codigo_salida, vencido.is_set(), limites, salida_error),
+        'tiempo_real_s': round(tiempo_real, 4),
+        'tiempo_cpu_s': round(uso.ru_utime + uso.ru_stime, 4),
+        'rss_max_kb': rss_max_kb,
+    }
+
+
+def ejecutar_lote(ruta_reporte, carpeta_entradas=CARPETA_ENTRADAS, procesos=None, limites=None):
+    """
+    Ejecuta todos los scripts del catálogo en un pool de procesos y guarda un reporte JSON.
+
+    Los scripts que usan input() leen su stdin de <carpeta_entradas>/<ruta del script>.stdin
+    (relativa a la carpeta del Dashboard); los que no tienen entrada reciben un stdin vacío.
+    Cada script corre con los límites de LIMITES_LOTE (o los indicados), así un input() sin
+    respuesta o una ventana abierta no bloquean el lote. El reporte tiene las claves ordenadas
+    para poder comparar dos corridas con diff.
+    """
+    if not hasattr(os, 'wait4') or not hasattr(os, 'waitid'):
+        print("El modo por lotes necesita os.wait4 y os.waitid (solo disponibles en sistemas Unix).")
+        return
+    limites = dict(LIMITES_LOTE, **(limites or {}))
+    ruta_base = os.path.dirname(os.path.abspath(__file__))
+    catalogo = actualizar_catalogo(ruta_base)
+    tareas = {}  # {ruta relativa con '/': (ruta absoluta del script, ruta de su entrada o None)}
+    for unidad in ordenar_unidades(catalogo):
+        for script in catalogo[unidad]:
+            ruta_script = os.path.join(ruta_base, unidad, script)
+            tareas[os.path.join(unidad, script).replace(os.sep, '/')] = (
+                ruta_script, ruta_entrada(ruta_script, carpeta_entradas))
+
+    resultados = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = {pool.submit(_ejecutar_en_lote, *tarea, limites): nombre for nombre, tarea in tareas.items()}
+        for futuro in concurrent.futures.as_completed(futuros):
+            nombre = futuros[futuro]
+            resultados[nombre] = futuro.result()
+            metricas = resultados[nombre]
+            memoria = '-' if metricas['rss_max_kb'] is None else metricas['rss_max_kb']
+            registrar_corrida(tareas[nombre][0], 'lote', metricas['resultado'], metricas['estado'],
+                              metricas['tiempo_real_s'])
+            print(f"[{metricas['estado']:>3}] {metricas['tiempo_real_s']:8.3f} s  {metricas['tiempo_cpu_s']:8.3f} s CPU  "
+                  f"{memoria:>8} KB  {metricas['resultado']:<14}  {nombre}")
+
+    reporte = {'python': platform.python_version(), 'limites': limites, 'scripts': resultados}
+    with open(ruta_reporte, 'w', encoding='utf-8') as archivo:
+        json.dump(reporte, archivo, ensure_ascii=False, sort_keys=True, indent=2)
+        archivo.write('\n')
+    fallidos = sum(1 for metricas in resultados.values() if metricas['resultado'] != 'ok')
+    print(f"{len(resultados)} scripts ejecutados, {fallidos} sin terminar bien. Reporte guardado en {ruta_reporte}.")
+
+
+def medir_cache_codigo():
+    """
+    Mide el tiempo de obtener el código de todos los scripts con la caché vacía, en disco y en memoria.
+
+    Es lo que hace el Dashboard al entregar cada script al grupo de intérpretes; la caché en memoria
+    sirve a partir de la segunda vez que se ejecuta el mismo script en la sesión.
+    """
+    ruta_base = os.path.dirname(os.path.abspath(__file__))
+    catalogo = actualizar_catalogo(ruta_base)
+    rutas = [os.path.join(ruta_base, unidad, script) for unidad in ordenar_unidades(catalogo) for script in catalogo[unidad]]
+
+    def medir():
+        inicio = time.perf_counter()
+        for ruta_script in rutas:
+            codigo_serializado(ruta_script)
+        return time.perf_counter() - inicio
+
+    carpeta_cache = ruta_datos('codigo')
+    os.makedirs(carpeta_cache, exist_ok=True)
+    for nombre in os.listdir(carpeta_cache):  # Vacía la caché en disco para la medición en frío
+        os.remove(os.path.join(carpeta_cache, nombre))
+    _codigo_compilado.clear()
+    en_frio = medir()  # Compila y escribe cada entrada
+    _codigo_compilado.clear()
+    desde_disco = medir()  # Solo lee los archivos marshal
+    en_memoria = medir()  # Solo lee el archivo fuente y calcula el hash
+
+    print(f"{len(rutas)} scripts")
+    print(f"En frío (compilar):                      {en_frio * 1000:8.2f} ms")
+    print(f"Caché en disco (marshal):                {desde_disco * 1000:8.2f} ms")
+    print(f"Caché en memoria (sesión del Dashboard): {en_memoria * 1000:8.2f} ms")
+
+
+def _primera_salida(proceso):
+    # Espera el primer byte que escribe el proceso y devuelve el instante en que llegó
+    proceso.stdout.read(1)
+    instante = time.perf_counter()
+    proceso.stdout.read()
+    proceso.wait()
+    return instante
+
+
+def medir_latencia(repeticiones=5):
+    """Compara el tiempo hasta la primera salida de un script con el intérprete nuevo y con el grupo."""
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as archivo:
+        archivo.write("print('listo', flush=True)\n")
+        ruta_script = archivo.name
+    try:
+        tiempos_directo = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            proceso = subprocess.Popen([sys.executable, ruta_script], stdout=subprocess.PIPE)
+            tiempos_directo.append(_primera_salida(proceso) - inicio)
+
+        pool = PoolInterpretes(tamano=1, stdout=subprocess.PIPE)
+        tiempos_pool = []
+        for _ in range(repeticiones):
+            time.sleep(1)  # Da tiempo a que el intérprete en espera termine de precargar
+            inicio = time.perf_counter()
+            proceso = pool.lanzar(ruta_script)
+            tiempos_pool.append(_primera_salida(proceso) - inicio)
+            pool.rellenar()
+        pool.cerrar()
+    finally:
+        os.remove(ruta_script)
+
+    print(f"Intérprete nuevo:  {min(tiempos_directo) * 1000:.1f} ms (mínimo de {repeticiones})")
+    print(f"Grupo precargado:  {min(tiempos_pool) * 1000:.1f} ms (mínimo de {repeticiones})")
+
+
 # Ejecutar el dashboard
 if __name__ == "__main__":  # Verifica si este archivo es el principal
-    mostrar_menu()  # Llama a la función para mostrar el menú ```python
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Dashboard de los scripts del curso de POO.")
+    parser.add_argument('--trabajador', type=int, help=argparse.SUPPRESS)  # Uso interno del grupo de intérpretes
+    parser.add_argument('--ejecutar', metavar='PETICION', help=argparse.SUPPRESS)  # Uso interno en Windows
+    parser.add_argument('--medir-latencia', action='store_true',
+                        help="compara la latencia de arranque con y sin el grupo de intérpretes")
+    parser.add_argument('--medir-cache', action='store_true',
+                        help="mide la caché de código compilado en frío y en caliente sobre todos los scripts")
+    parser.add_argument('--lote', metavar='REPORTE',
+                        help="ejecuta todos los scripts sin interacción y guarda las métricas en REPORTE (JSON)")
+    parser.add_argument('--entradas', default=CARPETA_ENTRADAS,
+                        help="carpeta con las entradas .stdin del modo por lotes y de las corridas memorizadas "
+                             "(por defecto: %(default)s)")
+    parser.add_argument('--procesos', type=int, default=None,
+                        help="procesos en paralelo del modo por lotes (por defecto: uno por CPU)")
+    parser.add_argument('--sin-memo', action='store_true',
+                        help="ejecuta siempre los scripts en lugar de repetir su salida memorizada")
+    parser.add_argument('--limite-tiempo', type=float, metavar='SEGUNDOS',
+                        help="tiempo real máximo de cada corrida (en el modo por lotes: %d s)" % LIMITES_LOTE['tiempo_real'])
+    parser.add_argument('--limite-cpu', type=int, metavar='SEGUNDOS',
+                        help="tiempo de CPU máximo de cada corrida (en el modo por lotes: %d s)" % LIMITES_LOTE['tiempo_cpu'])
+    parser.add_argument('--limite-memoria', type=int, metavar='MB',
+                        help="memoria máxima de cada corrida (en el modo por lotes: %d MB)" % LIMITES_LOTE['memoria_mb'])
+    argumentos = parser.parse_args()
+    limites_indicados = {clave: valor for clave, valor in (('tiempo_real', argumentos.limite_tiempo),
+                                                           ('tiempo_cpu', argumentos.limite_cpu),
+                                                           ('memoria_mb', argumentos.limite_memoria)) if valor}
+
+    if argumentos.trabajador is not None:
+        trabajador(argumentos.trabajador)  # Este proceso es un intérprete del grupo
+    elif argumentos.ejecutar:
+        ejecutar_peticion(json.loads(argumentos.ejecutar))  # Ejecuta un script con opciones (Windows)
+    elif argumentos.medir_latencia:
+        medir_latencia()  # Mide la latencia de ambos caminos de ejecución
+    elif argumentos.medir_cache:
+        medir_cache_codigo()  # Mide la caché de código compilado
+    elif argumentos.lote:
+        ejecutar_lote(argumentos.lote, argumentos.entradas, argumentos.procesos, limites_indicados)  # Modo por lotes
+    else:
+        limites_sesion.update(limites_indicados)  # Límites de las corridas interactivas y en segundo plano
+        usar_memo = not argumentos.sin_memo
+        carpeta_entradas_sesion = argumentos.entradas
+        mostrar_menu()  # Llama a la función para mostrar el menú ```python
\ No newline at end of file
@@ -1,4 +1,24 @@
+import atexit
+import contextlib
+import io
+import mmap
 import os
+import sqlite3
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+try:
+    import fcntl  # Bloqueos entre procesos (solo Linux/macOS)
+except ImportError:
+    fcntl = None
+
+CODIFICACION = 'utf-8'  # Todos los archivos de texto (foto y registro) se leen y escriben con esta codificación
 """
 Clase que representa un producto en el inventario.
 
@@ -31,18 +51,217 @@ class Producto:
             # Si hay un error en la conversión, devuelve None
             return None
 
+"""
+Diccionario de productos que se carga de a poco desde el archivo del inventario.
+
+Al crearlo solo se arma el índice {id_producto: posición de su línea} recorriendo el archivo
+mapeado en memoria (mmap); cada Producto se convierte desde su línea la primera vez que se
+pide. Así el arranque depende de cuántos IDs hay y no de convertir todos los registros.
+Una línea mal formada se descubre al pedirla y desde entonces cuenta como ausente, igual que
+en la carga completa. Recorrerlo o pedir su tamaño convierte las líneas que falten, para que
+las mal formadas no se cuenten; si nadie las pide, se copian tal cual en la próxima foto.
+"""
+class ProductosPerezosos(MutableMapping):
+    BLOQUE = 64 << 20  # Bytes del archivo que se indexan de una vez (acota la memoria temporal)
+
+    def __init__(self, archivo):
+        with open(archivo, 'rb') as f:
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # Sigue válido al cerrar f
+        self.posiciones = {}  # IDs todavía sin convertir -> posición de su línea
+        self.cargados = {}  # IDs ya convertidos (o agregados después) -> Producto
+        self._indexar()
+
+    # Método que arma el índice de posiciones por bloques de líneas completas
+    def _indexar(self):
+        inicio, tamano = 0, len(self.mapa)
+        while inicio < tamano:
+            fin = min(inicio + self.BLOQUE, tamano)
+            if fin < tamano:
+                fin = self.mapa.find(b'\n', fin) + 1 or tamano  # El bloque termina en un fin de línea
+            lineas = self.mapa[inicio:fin].split(b'\n')
+            # Todo con funciones de C: el ID es lo que está antes de la primera coma de cada línea,
+            # sin los espacios del comienzo (Producto.from_string también los quita)
+            ids = b'\n'.join([linea.partition(b',')[0] for linea in lineas]).decode(CODIFICACION)
+            ids = map(str.lstrip, ids.split('\n'))
+            posiciones = accumulate(map(len, lineas), lambda posicion, largo: posicion + largo + 1, initial=inicio)
+            self.posiciones.update(zip(ids, posiciones))  # Si un ID se repite, vale la última línea
+            inicio = fin
+        self.posiciones.pop('', None)  # Líneas vacías (incluida la que sigue al último salto de línea)
+
+    # Método que devuelve el texto de la línea que empieza en la posición indicada
+    def _linea(self, posicion):
+        fin = self.mapa.find(b'\n', posicion)
+        return self.mapa[posicion:fin if fin >= 0 else len(self.mapa)].decode(CODIFICACION)
+
+    def __getitem__(self, id_producto):
+        producto = self.cargados.get(id_producto)
+        if producto is None:
+            posicion = self.posiciones.pop(id_producto)  # KeyError si el ID no existe
+            producto = Producto.from_string(self._linea(posicion))
+            if producto is None:
+                raise KeyError(id_producto)  # Línea mal formada: el producto no se carga
+            self.cargados[id_producto] = producto
+        return producto
+
+    def __setitem__(self, id_producto, producto):
+        self.posiciones.pop(id_producto, None)
+        self.cargados[id_producto] = producto
+
+    def __delitem__(self, id_producto):
+        if self.posiciones.pop(id_producto, None) is None:
+            del self.cargados[id_producto]  # KeyError si el ID no existe
+
+    def __contains__(self, id_producto):
+        if id_producto in self.cargados:
+            return True
+        try:
+            self[id_producto]  # Convierte la línea: si está mal formada, el ID no cuenta
+            return True
+        except KeyError:
+            return False
+
+    # Método que convierte las líneas que nadie pidió; las mal formadas dejan de contar
+    def _convertir_pendientes(self):
+        for id_producto in list(self.posiciones):
+            try:
+                self[id_producto]
+            except KeyError:
+                pass
+
+    def __iter__(self):
+        self._convertir_pendientes()
+        yield from list(self.cargados)
+
+    def __len__(self):
+        self._convertir_pendientes()
+        return len(self.cargados)
+
+    # Método que da las líneas de la foto sin convertir los productos que nadie pidió
+    def lineas(self):
+        for posicion in self.posiciones.values():
+            yield self._linea(posicion) + '\n'
+        for producto in self.cargados.values():
+            yield str(producto) + '\n'
+
+# Función (de nivel de módulo, para poder enviarla a otro proceso) que convierte las líneas de un
+# rango de bytes del archivo. Devuelve las tuplas de los productos y las líneas rechazadas con su posición.
+def _analizar_rango(archivo, inicio, fin):
+    with open(archivo, 'rb') as f:
+        f.seek(inicio)
+        datos = f.read(fin - inicio)
+    productos, rechazadas = [], []
+    posicion = inicio
+    for linea in datos.split(b'\n'):
+        try:
+            texto = linea.decode(CODIFICACION).strip()
+            if texto:  # Las líneas en blanco se saltan sin reportarlas
+                id_producto, nombre, cantidad, precio = texto.split(',')
+                productos.append((id_producto, nombre, int(cantidad), float(precio)))
+        except ValueError:  # Incluye UnicodeDecodeError
+            rechazadas.append((posicion, linea.decode(CODIFICACION, errors='replace')))
+        posicion += len(linea) + 1
+    return productos, rechazadas
+
+# Función que carga un archivo de inventario repartiendo rangos de líneas completas entre varios procesos
+def cargar_en_paralelo(archivo, procesos=None, tamano_rango=None):
+    """
+    Devuelve (productos, rechazadas): el diccionario de productos y la lista de líneas que no se
+    pudieron convertir, como tuplas (posición en bytes, texto de la línea).
+
+    El archivo se parte en rangos de bytes que terminan en un salto de línea; cada proceso
+    convierte los suyos y los resultados se juntan en el orden del archivo, así que, como en
+    la carga normal, si un ID se repite vale la última línea.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    tamano = os.path.getsize(archivo)
+    tamano_rango = tamano_rango or max(tamano // (procesos * 4) + 1, 1 << 20)  # Unos 4 rangos por proceso
+    rangos = []
+    with open(archivo, 'rb') as f:
+        inicio = 0
+        while inicio < tamano:
+            f.seek(min(inicio + tamano_rango, tamano))
+            f.readline()  # Avanza hasta el final de la línea que quedó cortada
+            fin = min(f.tell(), tamano)
+            rangos.append((inicio, fin))
+            inicio = fin
+    productos, rechazadas = {}, []
+    with ProcessPoolExecutor(procesos) as ejecutor:
+        resultados = ejecutor.map(_analizar_rango, [archivo] * len(rangos), *zip(*rangos)) if rangos else []
+        for tuplas, malas in resultados:
+            for id_producto, nombre, cantidad, precio in tuplas:
+                productos[id_producto] = Producto(id_producto, nombre, cantidad, precio)
+            rechazadas.extend(malas)
+    return productos, rechazadas
+
+# Función que hace durable un cambio de nombre (os.replace) sincronizando la carpeta que lo contiene
+def sincronizar_carpeta(ruta):
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY)
+    except OSError:
+        return  # En Windows no se pueden abrir carpetas; allí el cambio de nombre ya es durable
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Algunos sistemas de archivos no permiten sincronizar carpetas
+    finally:
+        os.close(fd)
+
 """
 Clase que representa un inventario de productos.
 
+El archivo del inventario es una foto (snapshot) de todos los productos. Cada cambio no
+reescribe esa foto: se agrega una línea a un registro de operaciones (archivo + '.log'):
+    A,id,nombre,cantidad,precio   producto agregado
+    E,id                          producto eliminado
+    U,id,cantidad,precio          producto actualizado (campo vacío = sin cambio)
+Al cargar se lee la foto y se reaplica el registro. Cuando el registro pasa de umbral_log
+bytes, un hilo en segundo plano lo compacta: escribe una foto nueva y lo descarta.
+
+Cada línea deja al producto en un estado fijo (no suma ni resta), así que reaplicar un
+registro que ya estaba incluido en la foto no cambia el resultado.
+
+Durabilidad: las fotos se escriben en un archivo temporal que se sincroniza (fsync) y luego
+reemplaza a la foto vieja (os.replace), así que un corte nunca deja una foto a medias.
+Cada línea del registro se sincroniza al escribirla; con ventana_grupo (en segundos) las
+líneas que llegan dentro de la misma ventana se escriben y sincronizan juntas desde un
+hilo (escritura agrupada), y sincronizar() espera hasta que todo lo registrado sea durable.
+En ese modo los cambios no muestran "guardado con éxito", porque al volver todavía no están
+en disco: quedan guardados cuando sincronizar() vuelve sin error. Si una escritura falla, el
+lote vuelve a la cola para reintentarse en la ventana siguiente y sincronizar() lanza el error.
+
 Atributos:
     archivo (str): Nombre del archivo donde se guarda el inventario.
     productos (dict): Diccionario que almacena los productos, usando el ID del producto como clave.
+    log (str): Registro de operaciones pendientes de compactar.
+    umbral_log (int): Tamaño del registro (en bytes) a partir del cual se compacta.
+    ventana_grupo (float): Ventana de la escritura agrupada, o None para sincronizar cada cambio.
+    perezoso (bool): Si es True, productos es un ProductosPerezosos sobre el archivo mapeado.
+    procesos (int): Si se indica, la foto se carga con cargar_en_paralelo usando esos procesos.
+    rechazadas (list): Líneas de la foto que no se pudieron convertir (solo con procesos).
 """
 class Inventario:
+    UMBRAL_LOG = 1 << 20  # 1 MB de registro antes de compactar
+
     # Constructor de la clase Inventario
-    def __init__(self, archivo='inventario.txt'):
+    def __init__(self, archivo='inventario.txt', umbral_log=UMBRAL_LOG, ventana_grupo=None, perezoso=False,
+                 procesos=None):
         self.archivo = archivo  # Nombre del archivo donde se guarda el inventario
+        self.log = archivo + '.log'  # Registro de operaciones posteriores a la foto
+        self.log_compactando = archivo + '.log.1'  # Registro que se está pasando a una foto nueva
+        self.umbral_log = umbral_log
         self.productos = {}  # Diccionario para almacenar los productos
+        self.perezoso = perezoso
+        self.procesos = procesos
+        self.rechazadas = []
+        self._compactacion = None  # Hilo de la compactación en curso, si hay una
+        self.ventana_grupo = ventana_grupo
+        self._tamano_log = 0  # Tamaño del registro según la última escritura
+        self._pendientes = []  # Líneas que esperan la próxima escritura agrupada
+        self._encoladas = 0  # Líneas registradas en total (escritas o pendientes)
+        self._escritas = 0  # Líneas ya escritas y sincronizadas por la escritura agrupada
+        self._error = None  # Error de la última escritura agrupada, si falló
+        self._condicion = threading.Condition()
+        self._escritor = None  # Hilo de la escritura agrupada; se inicia con el primer cambio
         self.cargar_inventario()  # Carga el inventario desde el archivo
 
     # Método para cargar el inventario desde el archivo
@@ -52,46 +271,212 @@ class Inventario:
         # Si el archivo no existe, lo crea vacío
         if not os.path.exists(self.archivo):
             print("Archivo de inventario no encontrado. Creando uno nuevo...")
-            open(self.archivo, 'w').close()
+            open(self.archivo, 'w', encoding=CODIFICACION).close()
             return  # No hay nada más que cargar, así que salimos del método
 
         try:
-            # Abre el archivo en modo lectura con Context Managers (with)
-            with open(self.archivo, 'r') as f:
-                for line in f:
-                    producto = Producto.from_string(line)
-                    if producto:  # Verificar que la conversión fue exitosa
-                        self.productos[producto.id_producto] = producto
+            if self.perezoso and os.path.getsize(self.archivo):
+                self.productos = ProductosPerezosos(self.archivo)  # Solo arma el índice de IDs
+            elif self.procesos:
+                self.productos, self.rechazadas = cargar_en_paralelo(self.archivo, self.procesos)
+            else:
+                # Abre el archivo en modo lectura con Context Managers (with)
+                with open(self.archivo, 'r', encoding=CODIFICACION) as f:
+                    for line in f:
+                        producto = Producto.from_string(line)
+                        if producto:  # Verificar que la conversión fue exitosa
+                            self.productos[producto.id_producto] = producto
+            # Reaplica los cambios posteriores a la foto: primero el registro que se estaba
+            # compactando (si el programa se cerró a mitad de una compactación) y luego el actual.
+            for registro in (self.log_compactando, self.log):
+                if os.path.exists(registro):
+                    with open(registro, 'r', encoding=CODIFICACION) as f:
+                        for line in f:
+                            self._aplicar(line)
+            if os.path.exists(self.log):
+                self._tamano_log = os.path.getsize(self.log)
         except (FileNotFoundError, PermissionError) as e:
             print(f"Error al cargar el inventario: {e}")
 
+    # Método para aplicar una línea del registro de operaciones a los productos en memoria
+    def _aplicar(self, line):
+        operacion, _, resto = line.rstrip('\n').partition(',')
+        if operacion == 'A':
+            producto = Producto.from_string(resto)
+            if producto:
+                self.productos[producto.id_producto] = producto
+        elif operacion == 'E':
+            self.productos.pop(resto, None)
+        elif operacion == 'U':
+            try:
+                id_producto, cantidad, precio = resto.split(',')
+                producto = self.productos.get(id_producto)
+                if producto:
+                    if cantidad:
+                        producto.cantidad = int(cantidad)
+                    if precio:
+                        producto.precio = float(precio)
+            except ValueError:
+                pass  # Línea incompleta (por ejemplo, cortada por un cierre inesperado): se ignora
+        # Cualquier otra línea (vacía o cortada) se ignora
+
+    # Método para registrar un cambio agregando una sola línea al registro de operaciones
+    def _registrar(self, linea, mensaje=True):
+        try:
+            if self.ventana_grupo is None:
+                self._escribir_log([linea])  # La línea queda en disco antes de seguir
+                if mensaje:
+                    print("Inventario guardado con éxito.")
+            else:
+                with self._condicion:
+                    self._pendientes.append(linea)  # El hilo escritor la guarda al cerrar la ventana
+                    self._encoladas += 1
+                    if self._escritor is None:
+                        self._escritor = threading.Thread(target=self._escribir_en_grupo, daemon=True)
+                        self._escritor.start()
+                        atexit.register(self.sincronizar)  # Los cambios pendientes se guardan al salir
+                    self._condicion.notify()
+                # Sin mensaje de éxito: la línea aún no está en disco (ver sincronizar())
+            if self._tamano_log > self.umbral_log:
+                self.compactar()
+        except Exception as e:
+            # Captura cualquier excepción y muestra un mensaje de error
+            print(f"Error al guardar el inventario: {e}")
+
+    # Método que agrega líneas al registro con una sola escritura y las hace durables
+    def _escribir_log(self, lineas):
+        datos = ''.join(linea + '\n' for linea in lineas).encode(CODIFICACION)
+        with open(self.log, 'ab', buffering=0) as f:  # Sin búfer: lo que falle no se reescribe al cerrar
+            inicio = f.seek(0, os.SEEK_END)
+            try:
+                escritos = 0
+                while escritos < len(datos):
+                    escritos += f.write(datos[escritos:])
+                os.fsync(f.fileno())
+            except OSError:
+                # Se quita lo que llegó a escribirse, para que reintentar no deje una línea a medias
+                f.truncate(inicio)
+                raise
+            self._tamano_log = inicio + len(datos)
+
+    # Método del hilo escritor: junta los cambios de cada ventana en una sola escritura durable
+    def _escribir_en_grupo(self):
+        while True:
+            with self._condicion:
+                while not self._pendientes:
+                    self._condicion.wait()
+            time.sleep(self.ventana_grupo)  # Deja que lleguen los demás cambios de la ventana
+            with self._condicion:
+                lote, self._pendientes = self._pendientes, []
+            try:
+                self._escribir_log(lote)
+            except Exception as e:
+                with self._condicion:
+                    if self._error is None:
+                        print(f"Error al guardar el inventario: {e}")
+                    self._error = e
+                    self._pendientes[:0] = lote  # El lote vuelve al frente de la cola y se reintenta
+                    self._condicion.notify_all()  # sincronizar() informa el error en vez de esperar
+                continue
+            with self._condicion:
+                self._escritas += len(lote)
+                self._error = None
+                self._condicion.notify_all()  # Despierta a quienes esperan en sincronizar()
+
+    # Método que espera a que todos los cambios registrados hasta ahora estén en disco
+    def sincronizar(self):
+        with self._condicion:
+            objetivo = self._encoladas
+            while self._escritas < objetivo:
+                if self._error is not None:
+                    raise OSError(f"{objetivo - self._escritas} cambios sin guardar: {self._error}") from self._error
+                self._condicion.wait()
+
+    # Método para compactar el registro de operaciones en una foto nueva, en segundo plano
+    def compactar(self):
+        if self._compactacion and self._compactacion.is_alive():
+            return  # Ya hay una compactación en curso; el registro se compactará en la próxima
+        self.sincronizar()  # Los cambios pendientes deben quedar en el registro que se aparta
+        # Se aparta el registro actual (los cambios siguientes van a un registro nuevo) y se copia
+        # el estado en memoria; escribir la foto, que es lo lento, queda para el hilo.
+        self._apartar_log()
+        lineas = self._lineas_foto()
+        self._compactacion = threading.Thread(target=self._escribir_foto, args=(lineas,))
+        self._compactacion.start()
+
+    # Método que copia el estado en memoria como líneas de la foto
+    def _lineas_foto(self):
+        if isinstance(self.productos, ProductosPerezosos):
+            return list(self.productos.lineas())  # Sin convertir los productos que no se usaron
+        return [str(producto) + '\n' for producto in self.productos.values()]
+
+    # Método que mueve el registro actual al registro que se está compactando
+    def _apartar_log(self):
+        if not os.path.exists(self.log):
+            return
+        if os.path.exists(self.log_compactando):
+            # Quedó un registro de una compactación que no terminó: se le agrega el actual al final
+            # en lugar de reemplazarlo, para no perder sus cambios si la foto nueva no llega a escribirse.
+            with open(self.log, 'rb') as origen, open(self.log_compactando, 'ab') as destino:
+                destino.write(origen.read())
+                destino.flush()
+                os.fsync(destino.fileno())
+            os.remove(self.log)
+        else:
+            os.replace(self.log, self.log_compactando)
+        self._tamano_log = 0
+
+    # Método que escribe la foto en un archivo temporal y lo pone en lugar del anterior
+    def _escribir_foto(self, lineas):
+        temporal = self.archivo + '.tmp'
+        with open(temporal, 'w', encoding=CODIFICACION) as f:
+            f.writelines(lineas)
+            f.flush()
+            os.fsync(f.fileno())  # La foto nueva está completa en disco antes de reemplazar la vieja
+        os.replace(temporal, self.archivo)  # La foto vieja se reemplaza de una sola vez
+        sincronizar_carpeta(self.archivo)
+        if os.path.exists(self.log_compactando):
+            os.remove(self.log_compactando)  # Sus cambios ya están en la foto
+
     # Método para guardar el inventario en el archivo
     def guardar_inventario(self,mensaje=True):
         try:
-            # Abre el archivo en modo escritura
-            with open(self.archivo, 'w') as f:
-                for producto in self.productos.values():
-                    # Escribe cada producto en el archivo
-                    f.write(str(producto) + '\n')
+            self.sincronizar()  # Los cambios pendientes deben quedar en el registro antes de apartarlo
+            if self._compactacion:
+                self._compactacion.join()  # Espera a que termine la compactación en curso
+            self._apartar_log()  # Sus cambios quedan en la foto nueva
+            # Escribe cada producto en una foto nueva; con ella el registro de operaciones ya no hace falta
+            self._escribir_foto(self._lineas_foto())
             if mensaje:
                 print("Inventario guardado con éxito.")
         except Exception as e:
             # Captura cualquier excepción y muestra un mensaje de error
             print(f"Error al guardar el inventario: {e}")
 
+    # Métodos que guardan cada tipo de cambio; en este formato, como una línea del registro de operaciones
+    def _persistir_alta(self, producto):
+        self._registrar(f"A,{producto}")
+
+    def _persistir_baja(self, id_producto):
+        self._registrar(f"E,{id_producto}")
+
+    def _persistir_cambio(self, id_producto, cantidad, precio):
+        # Un campo vacío indica que no cambia
+        self._registrar(f"U,{id_producto},{'' if cantidad is None else cantidad},{'' if precio is None else precio}")
+
     # Método para agregar un producto al inventario
     def agregar_producto(self, producto):
         if producto.id_producto in self.productos:
             print("Producto ya existe.")  # Informa si el producto ya está en el inventario
         else:
             self.productos[producto.id_producto] = producto  # Agrega el producto al diccionario
-            self.guardar_inventario()  # Guarda el inventario en el archivo
+            self._persistir_alta(producto)  # Guarda el cambio en el archivo
 
     # Método para eliminar un producto del inventario
     def eliminar_producto(self, id_producto):
         if id_producto in self.productos:
             del self.productos[id_producto]  # Elimina el producto del diccionario
-            self.guardar_inventario()  # Guarda el inventario en el archivo
+            self._persistir_baja(id_producto)  # Guarda el cambio en el archivo
             print(f"Producto {id_producto} eliminado.")
         else:
             print("Producto no encontrado.")  # Informa si el producto no está en el inventario
@@ -103,7 +488,7 @@ class Inventario:
                 self.productos[id_producto].cantidad = cantidad  # Actualiza la cantidad
             if precio is not None:
                 self.productos[id_producto].precio = precio  # Actualiza el precio
-            self.guardar_inventario()  # Guarda el inventario en el archivo
+            self._persistir_cambio(id_producto, cantidad, precio)  # Guarda el cambio en el archivo
             print(f"Producto {id_producto} actualizado.")
         else:
             print("Producto no encontrado.")  # Informa si el producto no está en el inventario
@@ -135,9 +520,456 @@ class Inventario:
                 print(
                     f"ID: {producto.id_producto}, Nombre: {producto.nombre}, Cantidad: {producto.cantidad}, Precio: ${producto.precio:.2f}")
 
+"""
+Inventario guardado en un archivo binario de registros de ancho fijo (módulo struct).
+
+El archivo empieza con una cabecera (firma, versión y anchos de los campos) y sigue con
+ranuras de igual tamaño: estado (1 = ocupada, 0 = libre), ID, nombre, cantidad y precio.
+Como cada producto ocupa siempre la misma ranura, actualizar la cantidad o el precio es
+escribir 8 bytes en su posición (os.pwrite), y eliminar es marcar la ranura como libre;
+las ranuras libres se anotan en una lista y se reutilizan en las próximas altas.
+
+Atributos (además de los de Inventario):
+    ranuras (dict): ID del producto -> número de ranura en el archivo.
+    libres (list): Ranuras libres para reutilizar.
+    rechazadas (list): Productos que desde_texto no convirtió porque su ID o nombre no caben.
+"""
+class InventarioBinario(Inventario):
+    FIRMA = b'INVB'
+    VERSION = 1
+    CABECERA = struct.Struct('<4sHHH')  # Firma, versión, ancho del ID y ancho del nombre (en bytes)
+
+    # Constructor: los anchos solo se usan al crear un archivo nuevo; si no, se leen de la cabecera
+    def __init__(self, archivo='inventario.bin', ancho_id=16, ancho_nombre=64):
+        self.ancho_id = ancho_id
+        self.ancho_nombre = ancho_nombre
+        self.ranuras = {}
+        self.libres = []
+        super().__init__(archivo)
+
+    # Método que arma el formato de una ranura y la posición de cada campo dentro de ella
+    def _formato(self):
+        self.registro = struct.Struct(f'<B{self.ancho_id}s{self.ancho_nombre}sqd')
+        self.desplazamiento_cantidad = 1 + self.ancho_id + self.ancho_nombre
+        self.desplazamiento_precio = self.desplazamiento_cantidad + 8
+
+    # Método que devuelve la posición en el archivo de una ranura
+    def _posicion(self, ranura):
+        return self.CABECERA.size + ranura * self.registro.size
+
+    # Método para cargar el inventario desde el archivo binario
+    def cargar_inventario(self):
+        """Carga el inventario desde el archivo binario, creándolo si no existe."""
+        self.fd = os.open(self.archivo, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o666)
+        cabecera = self._leer(0, self.CABECERA.size)
+        if not cabecera:
+            # Archivo nuevo: solo la cabecera
+            self._escribir(0, self.CABECERA.pack(self.FIRMA, self.VERSION, self.ancho_id, self.ancho_nombre))
+            self._formato()
+            self.total_ranuras = 0
+            return
+        firma, version, self.ancho_id, self.ancho_nombre = self.CABECERA.unpack(cabecera)
+        if firma != self.FIRMA or version != self.VERSION:
+            raise ValueError(f"{self.archivo} no es un inventario binario válido.")
+        self._formato()
+        datos = self._leer(self.CABECERA.size, os.fstat(self.fd).st_size - self.CABECERA.size)
+        completos = len(datos) - len(datos) % self.registro.size  # Descarta una ranura final cortada
+        for ranura, (estado, id_producto, nombre, cantidad, precio) in enumerate(
+                self.registro.iter_unpack(datos[:completos])):
+            if estado:
+                id_producto = id_producto.rstrip(b'\0').decode()
+                self.productos[id_producto] = Producto(id_producto, nombre.rstrip(b'\0').decode(), cantidad, precio)
+                self.ranuras[id_producto] = ranura
+            else:
+                self.libres.append(ranura)
+        self.total_ranuras = completos // self.registro.size
+        self.libres.reverse()  # Se reutilizan primero las ranuras más cercanas al comienzo
+
+    # Método que lee bytes desde una posición del archivo
+    def _leer(self, posicion, cantidad):
+        if hasattr(os, 'pread'):
+            return os.pread(self.fd, cantidad, posicion)
+        os.lseek(self.fd, posicion, os.SEEK_SET)  # Windows no tiene pread
+        return os.read(self.fd, cantidad)
+
+    # Método que escribe bytes en una posición del archivo y los hace durables
+    def _escribir(self, posicion, datos, sincronizar=True):
+        if hasattr(os, 'pwrite'):
+            os.pwrite(self.fd, datos, posicion)
+        else:  # Windows no tiene pwrite
+            os.lseek(self.fd, posicion, os.SEEK_SET)
+            os.write(self.fd, datos)
+        if sincronizar:
+            os.fsync(self.fd)
+
+    # Método que indica si el ID y el nombre caben en su campo (struct cortaría el resto sin avisar)
+    def _cabe(self, producto):
+        return (len(producto.id_producto.encode()) <= self.ancho_id
+                and len(producto.nombre.encode()) <= self.ancho_nombre)
+
+    # Método para agregar un producto: el ID y el nombre deben caber en su campo
+    def agregar_producto(self, producto):
+        if not self._cabe(producto):
+            print(f"Error: el ID admite hasta {self.ancho_id} bytes y el nombre hasta {self.ancho_nombre}.")
+            return
+        super().agregar_producto(producto)
+
+    # Método que escribe un producto en una ranura libre (o en una nueva al final del archivo)
+    def _ocupar_ranura(self, producto, sincronizar=True):
+        if not self._cabe(producto):
+            raise ValueError(f"el ID admite hasta {self.ancho_id} bytes y el nombre hasta {self.ancho_nombre}.")
+        if self.libres:
+            ranura = self.libres.pop()
+        else:
+            ranura = self.total_ranuras
+            self.total_ranuras += 1
+        self._escribir(self._posicion(ranura), self.registro.pack(
+            1, producto.id_producto.encode(), producto.nombre.encode(), producto.cantidad, producto.precio),
+            sincronizar)
+        self.ranuras[producto.id_producto] = ranura
+
+    # Métodos que guardan cada cambio escribiendo solo los bytes que cambian
+    def _persistir_alta(self, producto):
+        try:
+            self._ocupar_ranura(producto)
+            print("Inventario guardado con éxito.")
+        except Exception as e:
+            print(f"Error al guardar el inventario: {e}")
+
+    def _persistir_baja(self, id_producto):
+        try:
+            ranura = self.ranuras.pop(id_producto)
+            self._escribir(self._posicion(ranura), b'\0')  # Solo el byte de estado: la ranura queda libre
+            self.libres.append(ranura)
+            print("Inventario guardado con éxito.")
+        except Exception as e:
+            print(f"Error al guardar el inventario: {e}")
+
+    def _persistir_cambio(self, id_producto, cantidad, precio):
+        try:
+            posicion = self._posicion(self.ranuras[id_producto])
+            if cantidad is not None and precio is not None:
+                # Los dos campos están juntos en la ranura: una sola escritura de 16 bytes
+                self._escribir(posicion + self.desplazamiento_cantidad, struct.pack('<qd', cantidad, precio))
+            elif cantidad is not None:
+                self._escribir(posicion + self.desplazamiento_cantidad, struct.pack('<q', cantidad))
+            elif precio is not None:
+                self._escribir(posicion + self.desplazamiento_precio, struct.pack('<d', precio))
+            print("Inventario guardado con éxito.")
+        except Exception as e:
+            print(f"Error al guardar el inventario: {e}")
+
+    # Cada cambio ya queda escrito en su lugar: guardar solo confirma que todo está en disco
+    def guardar_inventario(self, mensaje=True):
+        try:
+            os.fsync(self.fd)
+            if mensaje:
+                print("Inventario guardado con éxito.")
+        except Exception as e:
+            print(f"Error al guardar el inventario: {e}")
+
+    # Método que crea un inventario binario con los productos de un inventario de texto.
+    # Los productos cuyo ID o nombre no caben en su campo no se convierten: quedan en rechazadas.
+    @classmethod
+    def desde_texto(cls, archivo_texto, archivo='inventario.bin', **anchos):
+        binario = cls(archivo, **anchos)
+        for producto in Inventario(archivo_texto).productos.values():
+            if producto.id_producto in binario.productos:
+                continue
+            if not binario._cabe(producto):
+                binario.rechazadas.append(str(producto))
+                continue
+            binario.productos[producto.id_producto] = producto
+            binario._ocupar_ranura(producto, sincronizar=False)
+        os.fsync(binario.fd)  # Una sola sincronización para toda la conversión
+        if binario.rechazadas:
+            print(f"{len(binario.rechazadas)} productos no se convirtieron: el ID admite hasta "
+                  f"{binario.ancho_id} bytes y el nombre hasta {binario.ancho_nombre}.")
+        return binario
+
+"""
+Inventario que varios procesos (por ejemplo, varios menús abiertos) pueden usar a la vez
+sobre el mismo inventario.txt sin pisarse los cambios.
+
+- Bloqueo: antes de leer o cambiar algo se toma un bloqueo de fcntl sobre archivo + '.lock'
+  (compartido para leer, exclusivo para cambiar o compactar).
+- Detección de cambios: el registro de operaciones empieza con una línea "G,<generación>"
+  que aumenta en cada compactación. Cada proceso recuerda la generación, la posición hasta
+  la que leyó el registro y su tamaño, fecha de modificación e inodo; si nada de eso cambió
+  no lee nada.
+- Recarga incremental: si otro proceso agregó operaciones, solo se leen y aplican las líneas
+  nuevas del final del registro. Solo cuando la generación cambió (otro proceso compactó)
+  se vuelve a cargar la foto completa; como eso puede escribir archivos (un registro nuevo),
+  las consultas lo hacen soltando el bloqueo compartido y tomando el exclusivo.
+
+Cada cambio se hace con el bloqueo exclusivo después de ponerse al día, así que la
+comprobación (por ejemplo, "el producto ya existe") ve los cambios de los demás procesos.
+La compactación se hace en el momento (no en segundo plano) y sin escritura agrupada,
+porque ambas escribirían fuera del bloqueo. Todos los procesos deben usar esta clase.
+"""
+class InventarioCompartido(Inventario):
+    # Constructor de la clase InventarioCompartido
+    def __init__(self, archivo='inventario.txt', umbral_log=Inventario.UMBRAL_LOG, perezoso=False):
+        if fcntl is None:
+            raise OSError("InventarioCompartido necesita fcntl (Linux o macOS).")
+        self._fd_bloqueo = os.open(archivo + '.lock', os.O_RDWR | os.O_CREAT, 0o666)
+        self._bloqueos = 0  # Cuántos bloqueos anidados tiene este proceso
+        self._exclusivo = False  # Si el bloqueo que se tiene es el exclusivo
+        self.generacion = 0
+        self._posicion_log = 0  # Hasta dónde se leyó el registro de operaciones
+        self._firma_log = None  # (inodo, tamaño, fecha de modificación) del registro leído
+        super().__init__(archivo, umbral_log, None, perezoso)
+
+    # Método que toma el bloqueo entre procesos (si ya se tiene, solo lo anida). Pedir el exclusivo
+    # teniendo el compartido es un error: flock no lo cambia de una vez y otro proceso podría
+    # escribir en el medio.
+    @contextlib.contextmanager
+    def _bloqueo(self, exclusivo):
+        if not self._bloqueos:
+            fcntl.flock(self._fd_bloqueo, fcntl.LOCK_EX if exclusivo else fcntl.LOCK_SH)
+            self._exclusivo = exclusivo
+        elif exclusivo and not self._exclusivo:
+            raise RuntimeError("No se puede pedir el bloqueo exclusivo dentro del compartido.")
+        self._bloqueos += 1
+        try:
+            yield
+        finally:
+            self._bloqueos -= 1
+            if not self._bloqueos:
+                fcntl.flock(self._fd_bloqueo, fcntl.LOCK_UN)
+
+    # Método que lee la generación de la primera línea del registro
+    def _leer_generacion(self):
+        try:
+            with open(self.log, 'r', encoding=CODIFICACION) as f:
+                operacion, _, generacion = f.readline().strip().partition(',')
+            return int(generacion) if operacion == 'G' else 0
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    # Método que recuerda hasta dónde se leyó el registro (todo, porque se tiene el bloqueo)
+    def _anotar_log(self):
+        estado = os.stat(self.log)
+        self.generacion = self._leer_generacion()
+        self._posicion_log = estado.st_size
+        self._firma_log = (estado.st_ino, estado.st_size, estado.st_mtime_ns)
+
+    # Método que empieza un registro vacío de la generación indicada
+    def _nuevo_log(self, generacion):
+        temporal = self.log + '.tmp'
+        with open(temporal, 'w', encoding=CODIFICACION) as f:
+            f.write(f"G,{generacion}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.log)
+        sincronizar_carpeta(self.log)
+        self._anotar_log()
+
+    # Método para cargar el inventario completo (foto y registro)
+    def cargar_inventario(self):
+        with self._bloqueo(exclusivo=True):
+            self.productos = {}
+            super().cargar_inventario()
+            if os.path.exists(self.log):
+                self._anotar_log()
+            else:
+                self._nuevo_log(0)
+
+    # Método que aplica los cambios que hicieron otros procesos desde la última lectura.
+    # Si hace falta recargar todo y recargar es False, no hace nada y devuelve False.
+    def _refrescar(self, recargar=True):
+        try:
+            estado = os.stat(self.log)
+        except FileNotFoundError:
+            estado = None
+        if estado and (estado.st_ino, estado.st_size, estado.st_mtime_ns) == self._firma_log:
+            return True  # El registro no cambió
+        if estado and self._leer_generacion() == self.generacion and estado.st_size >= self._posicion_log:
+            # Misma generación: solo se leen las operaciones agregadas al final
+            with open(self.log, 'rb') as f:
+                f.seek(self._posicion_log)
+                nuevas = f.read()
+            for line in nuevas.decode(CODIFICACION).splitlines():
+                self._aplicar(line)
+            self._anotar_log()
+        elif recargar:
+            self.cargar_inventario()  # Otro proceso compactó: la foto es nueva
+        else:
+            return False
+        return True
+
+    # Método que se pone al día para una consulta: con el bloqueo compartido si alcanza con leer
+    # el final del registro, y con el exclusivo si hay que recargar todo
+    @contextlib.contextmanager
+    def _consulta(self):
+        with self._bloqueo(exclusivo=False):
+            if self._refrescar(recargar=False):
+                yield
+                return
+        with self._bloqueo(exclusivo=True):
+            self._refrescar()
+            yield
+
+    # Los cambios se hacen con el bloqueo exclusivo y después de ponerse al día
+    def agregar_producto(self, producto):
+        with self._bloqueo(exclusivo=True):
+            self._refrescar()
+            super().agregar_producto(producto)
+            self._anotar_log()
+
+    def eliminar_producto(self, id_producto):
+        with self._bloqueo(exclusivo=True):
+            self._refrescar()
+            super().eliminar_producto(id_producto)
+            self._anotar_log()
+
+    def actualizar_producto(self, id_producto, cantidad=None, precio=None):
+        with self._bloqueo(exclusivo=True):
+            self._refrescar()
+            super().actualizar_producto(id_producto, cantidad, precio)
+            self._anotar_log()
+
+    # Las consultas se ponen al día con el bloqueo compartido (o el exclusivo, si hay que recargar)
+    def buscar_producto(self, nombre):
+        with self._consulta():
+            super().buscar_producto(nombre)
+
+    def mostrar_inventario(self):
+        with self._consulta():
+            super().mostrar_inventario()
+
+    # Método que compacta en el momento: foto nueva y registro vacío de la generación siguiente
+    def compactar(self):
+        with self._bloqueo(exclusivo=True):
+            self._refrescar()
+            # Primero la foto: si el proceso se corta antes de cambiar el registro, reaplicar
+            # el registro viejo sobre la foto nueva no cambia nada.
+            self._escribir_foto(self._lineas_foto())
+            self._nuevo_log(self.generacion + 1)
+
+    # Método para guardar el inventario en el archivo
+    def guardar_inventario(self, mensaje=True):
+        try:
+            self.compactar()
+            if mensaje:
+                print("Inventario guardado con éxito.")
+        except Exception as e:
+            print(f"Error al guardar el inventario: {e}")
+
+"""
+Inventario guardado en una base de datos SQLite, con los mismos métodos que Inventario.
+
+La tabla productos tiene como clave primaria id_producto y un índice sobre lower(nombre),
+así que eliminar, actualizar y buscar por nombre son consultas por índice en lugar de
+recorrer el diccionario o reescribir el archivo. La base usa el modo WAL: cada cambio se
+confirma agregándolo al archivo -wal, y guardar_inventario lo vuelca a la base.
+
+Nota: lower() de SQLite solo pasa a minúsculas las letras ASCII (no las tildes ni la Ñ).
+
+Atributos:
+    archivo (str): Nombre del archivo de la base de datos.
+    conexion (sqlite3.Connection): Conexión abierta con la base.
+"""
+class InventarioSQLite:
+    # Constructor de la clase InventarioSQLite
+    def __init__(self, archivo='inventario.db'):
+        self.archivo = archivo
+        self.conexion = None
+        self.cargar_inventario()
+
+    # Método que abre la base y crea la tabla y el índice si no existen
+    def cargar_inventario(self):
+        """Abre (o crea) la base de datos del inventario."""
+        if not os.path.exists(self.archivo):
+            print("Archivo de inventario no encontrado. Creando uno nuevo...")
+        try:
+            self.conexion = sqlite3.connect(self.archivo)
+            self.conexion.execute("PRAGMA journal_mode=WAL")
+            with self.conexion:
+                self.conexion.execute(
+                    "CREATE TABLE IF NOT EXISTS productos (id_producto TEXT PRIMARY KEY, nombre TEXT NOT NULL, "
+                    "cantidad INTEGER NOT NULL, precio REAL NOT NULL) WITHOUT ROWID")
+                self.conexion.execute("CREATE INDEX IF NOT EXISTS productos_nombre ON productos (lower(nombre))")
+        except sqlite3.Error as e:
+            print(f"Error al cargar el inventario: {e}")
+
+    # Método que vuelca a la base los cambios confirmados en el archivo -wal
+    def guardar_inventario(self, mensaje=True):
+        try:
+            self.conexion.commit()
+            self.conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if mensaje:
+                print("Inventario guardado con éxito.")
+        except sqlite3.Error as e:
+            print(f"Error al guardar el inventario: {e}")
+
+    # Método para agregar un producto al inventario
+    def agregar_producto(self, producto):
+        try:
+            with self.conexion:  # Confirma el cambio (o lo deshace si falla)
+                self.conexion.execute("INSERT INTO productos VALUES (?, ?, ?, ?)",
+                                      (producto.id_producto, producto.nombre, producto.cantidad, producto.precio))
+            print("Inventario guardado con éxito.")
+        except sqlite3.IntegrityError:
+            print("Producto ya existe.")  # La clave primaria no admite IDs repetidos
+        except sqlite3.Error as e:
+            print(f"Error al guardar el inventario: {e}")
+
+    # Método para agregar muchos productos en una sola transacción (los IDs existentes se reemplazan)
+    def importar(self, productos):
+        with self.conexion:
+            self.conexion.executemany("INSERT OR REPLACE INTO productos VALUES (?, ?, ?, ?)",
+                                      ((p.id_producto, p.nombre, p.cantidad, p.precio) for p in productos))
+
+    # Método para eliminar un producto del inventario
+    def eliminar_producto(self, id_producto):
+        with self.conexion:
+            eliminados = self.conexion.execute("DELETE FROM productos WHERE id_producto = ?", (id_producto,)).rowcount
+        if eliminados:
+            print("Inventario guardado con éxito.")
+            print(f"Producto {id_producto} eliminado.")
+        else:
+            print("Producto no encontrado.")  # Informa si el producto no está en el inventario
+
+    # Método para actualizar la cantidad y/o precio de un producto
+    def actualizar_producto(self, id_producto, cantidad=None, precio=None):
+        with self.conexion:
+            # coalesce deja el valor actual cuando el nuevo es None
+            actualizados = self.conexion.execute(
+                "UPDATE productos SET cantidad = coalesce(?, cantidad), precio = coalesce(?, precio) "
+                "WHERE id_producto = ?", (cantidad, precio, id_producto)).rowcount
+        if actualizados:
+            print("Inventario guardado con éxito.")
+            print(f"Producto {id_producto} actualizado.")
+        else:
+            print("Producto no encontrado.")  # Informa si el producto no está en el inventario
+
+    # Método para buscar un producto por su nombre (usa el índice sobre lower(nombre))
+    def buscar_producto(self, nombre):
+        fila = self.conexion.execute("SELECT * FROM productos WHERE lower(nombre) = lower(?) LIMIT 1",
+                                     (nombre,)).fetchone()
+        if fila:
+            print(f"ID: {fila[0]}, Nombre: {fila[1]}, Cantidad: {fila[2]}, Precio: ${fila[3]:.2f}")
+        else:
+            print("Producto no encontrado en el inventario.")  # Mensaje si no se encuentra el producto
+
+    # Método para mostrar todos los productos en el inventario
+    def mostrar_inventario(self):
+        filas = self.conexion.execute("SELECT * FROM productos")
+        fila = filas.fetchone()
+        if fila is None:
+            print("El inventario está vacío.")  # Informa si no hay productos
+        while fila is not None:
+            print(f"ID: {fila[0]}, Nombre: {fila[1]}, Cantidad: {fila[2]}, Precio: ${fila[3]:.2f}")
+            fila = filas.fetchone()
+
+    # Método que cierra la conexión con la base
+    def cerrar(self):
+        self.conexion.close()
+
 # Función principal que muestra el menú y gestiona las opciones del usuario
-def menu():
-    inventario = Inventario()  # Crea una instancia de Inventario
+def menu(inventario=None):
+    inventario = inventario or Inventario()  # Crea una instancia de Inventario
 
     while True:
         # Muestra las opciones del menú
@@ -186,6 +1018,94 @@ def menu():
             print("Inventario guardando y Saliendo...")  # Mensaje de salida
             break  # Sale del bucle
 
+# Función que mide el arranque (crear el Inventario) leyendo todo o solo el índice de IDs
+def benchmark_arranque(cantidades=(1_000_000, 10_000_000)):
+    carpeta = tempfile.mkdtemp()
+    for cantidad in cantidades:
+        archivo = os.path.join(carpeta, f"inventario_{cantidad}.txt")
+        with open(archivo, 'w', encoding=CODIFICACION) as f:
+            for i in range(0, cantidad, 100_000):
+                f.writelines(f"P{j:08d},Producto {j},{j % 500},{j % 97 + 0.25}\n"
+                             for j in range(i, min(i + 100_000, cantidad)))
+        print(f"\n{cantidad} líneas ({os.path.getsize(archivo) / 1e6:.0f} MB)")
+        for perezoso in (True, False):
+            inicio = time.perf_counter()
+            inventario = Inventario(archivo, perezoso=perezoso)
+            arranque = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            producto = inventario.productos[f"P{cantidad // 2:08d}"]
+            acceso = time.perf_counter() - inicio
+            print(f"  {'perezoso' if perezoso else 'completo':<9} arranque {arranque:6.2f} s, "
+                  f"primer acceso {acceso * 1e6:7.1f} µs ({producto.nombre})")
+            del inventario, producto
+        os.remove(archivo)
+    os.rmdir(carpeta)
+
+# Función que compara la carga normal con la carga en paralelo y muestra las líneas rechazadas
+def benchmark_carga(cantidad=1_000_000, procesos=(1, 2, 4)):
+    carpeta = tempfile.mkdtemp()
+    archivo = os.path.join(carpeta, "inventario.txt")
+    with open(archivo, 'w', encoding=CODIFICACION) as f:
+        for i in range(cantidad):
+            # Una de cada 100 000 líneas está mal formada, para que haya algo que reportar
+            f.write(f"P{i:08d},Producto {i},{'x' if i % 100_000 == 7 else i % 500},{i % 97 + 0.25}\n")
+    print(f"{cantidad} líneas, {os.cpu_count()} CPU")
+    inicio = time.perf_counter()
+    Inventario(archivo)
+    print(f"  normal       {time.perf_counter() - inicio:6.2f} s")
+    for cantidad_procesos in procesos:
+        inicio = time.perf_counter()
+        inventario = Inventario(archivo, procesos=cantidad_procesos)
+        print(f"  {cantidad_procesos} procesos   {time.perf_counter() - inicio:6.2f} s, "
+              f"{len(inventario.rechazadas)} líneas rechazadas")
+    for posicion, linea in inventario.rechazadas[:3]:
+        print(f"    byte {posicion}: {linea!r}")
+    os.remove(archivo)
+    os.rmdir(carpeta)
+
+# Función que compara el inventario de texto (con registro de operaciones) con el de SQLite
+def benchmark_sqlite(cantidad=100_000, operaciones=2_000):
+    carpeta = tempfile.mkdtemp()
+    productos = [Producto(f"P{i:07d}", f"Producto {i}", i % 500, i % 97 + 0.25) for i in range(cantidad)]
+    with open(os.path.join(carpeta, "inventario.txt"), 'w', encoding=CODIFICACION) as f:
+        f.writelines(str(producto) + '\n' for producto in productos)
+    InventarioSQLite(os.path.join(carpeta, "inventario.db")).importar(productos)
+    ids = [producto.id_producto for producto in productos[::cantidad // operaciones]][:operaciones]
+    print(f"{cantidad} productos, {len(ids)} operaciones de cada tipo")
+    for nombre, crear in (("texto", lambda: Inventario(os.path.join(carpeta, "inventario.txt"))),
+                          ("SQLite", lambda: InventarioSQLite(os.path.join(carpeta, "inventario.db")))):
+        tiempos = []
+        with contextlib.redirect_stdout(io.StringIO()):  # Los mensajes de cada operación no se miden
+            inicio = time.perf_counter()
+            inventario = crear()
+            tiempos.append(time.perf_counter() - inicio)
+            for operacion in (lambda i: inventario.buscar_producto(f"Producto {int(i[1:])}"),
+                              lambda i: inventario.actualizar_producto(i, 1, 2.5),
+                              lambda i: inventario.eliminar_producto(i)):
+                inicio = time.perf_counter()
+                for id_producto in ids:
+                    operacion(id_producto)
+                tiempos.append(time.perf_counter() - inicio)
+            inventario.guardar_inventario()
+        print(f"  {nombre:<7} carga {tiempos[0] * 1000:8.1f} ms, búsquedas {tiempos[1] * 1000:8.1f} ms, "
+              f"cambios {tiempos[2] * 1000:8.1f} ms, bajas {tiempos[3] * 1000:8.1f} ms")
+    for archivo in os.listdir(carpeta):
+        os.remove(os.path.join(carpeta, archivo))
+    os.rmdir(carpeta)
+
 # ```python
 if __name__ == "__main__":
-    menu()  # Llama a la función menu para iniciar el programa
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == '--benchmark-arranque':
+        benchmark_arranque()  # Compara el arranque completo con el perezoso
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark-carga':
+        benchmark_carga()  # Compara la carga normal con la carga en paralelo
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark-sqlite':
+        benchmark_sqlite()  # Compara el inventario de texto con el de SQLite
+    elif len(sys.argv) > 1 and sys.argv[1] == '--sqlite':
+        menu(InventarioSQLite())  # Usa la base de datos SQLite (inventario.db)
+    elif len(sys.argv) > 1 and sys.argv[1] == '--compartido':
+        menu(InventarioCompartido())  # Permite abrir varios menús sobre el mismo inventario.txt
+    elif len(sys.argv) > 1 and sys.argv[1] == '--binario':
+        menu(InventarioBinario())  # Usa el formato binario (inventario.bin)
+    else:
+        menu()  # Llama a la función menu para iniciar el programa
\ No newline at end of file
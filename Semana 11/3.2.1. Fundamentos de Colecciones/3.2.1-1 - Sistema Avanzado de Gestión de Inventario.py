@@ -1,4 +1,20 @@
+import atexit
+import contextlib
+import io
 import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+def _guardar_al_salir(referencia):
+    """Guarda lo pendiente de un inventario al salir del programa, si el inventario todavía existe."""
+    inventario = referencia()
+    if inventario is not None:
+        inventario.flush()
 
 class Producto:
     """
@@ -19,13 +35,36 @@ class Inventario:
     """
     Esta clase gestiona un inventario de productos, proporcionando métodos para
     agregar, eliminar, actualizar, buscar y mostrar productos.
+
+    Los cambios no reescriben el archivo en el momento: marcan el inventario como "sucio" y
+    un temporizador lo guarda en segundo plano cuando pasan RETRASO segundos sin cambios nuevos
+    (pero nunca más de RETRASO_MAXIMO segundos después del primer cambio pendiente, para que
+    una ráfaga que no termina también se guarde). Así, una ráfaga de miles de cambios se guarda
+    con una sola escritura del JSON.
+    flush() guarda en el momento lo que esté pendiente, y también se llama al salir del programa
+    (mediante una referencia débil, así que registrarlo no mantiene vivo al inventario).
+    El JSON se escribe en un archivo temporal que luego reemplaza al anterior, y el inventario
+    solo deja de estar sucio si la escritura terminó bien; si falla, el próximo cambio (o la
+    salida del programa) vuelve a intentarlo.
     """
-    def __init__(self):
+    RETRASO = 0.5  # Segundos sin cambios que se esperan antes de guardar
+    RETRASO_MAXIMO = 5.0  # Segundos como máximo entre el primer cambio pendiente y el guardado
+
+    def __init__(self, retraso=RETRASO, retraso_maximo=RETRASO_MAXIMO):
         # Constructor de la clase Inventario
         self.productos = {}  # Diccionario para almacenar los productos
+        self.archivo = 'inventario.json'  # Archivo del que se cargó el inventario
+        self.retraso = retraso
+        self.retraso_maximo = retraso_maximo
+        self._sucio = False  # Hay cambios que todavía no están en el archivo
+        self._temporizador = None  # Guardado en segundo plano pendiente
+        self._primer_cambio = self._ultimo_cambio = 0.0  # Momentos (time.monotonic) de los cambios pendientes
+        self._cerrojo = threading.RLock()  # Evita guardar mientras se está cambiando un producto
+        self._salida_registrada = False
 
     def cargar_inventario(self, archivo='inventario.json'):
         """Carga los datos del inventario desde un archivo JSON."""
+        self.archivo = archivo  # Los guardados posteriores van al mismo archivo
         try:
             with open(archivo, 'r') as f:
                 data = json.load(f)  # Cargar datos desde el archivo JSON
@@ -39,63 +78,313 @@ class Inventario:
         except PermissionError:
             print("Error: No tienes permiso para acceder al archivo de inventario.")
 
-    def guardar_inventario(self, archivo='inventario.json'):
+    def guardar_inventario(self, archivo=None):
         """Guarda el inventario en un archivo JSON."""
         try:
-            with open(archivo, 'w') as f:
-                json.dump({id_prod: vars(prod) for id_prod, prod in self.productos.items()}, f, indent=4)  # Guardar productos en JSON
+            self._escribir(archivo or self.archivo)
             print("Inventario guardado correctamente.")
         except PermissionError:
             print("Error: No tienes permiso para escribir en el archivo de inventario.")
         except Exception as e:
             print(f"Error inesperado al guardar el inventario: {e}")
 
+    def _escribir(self, archivo):
+        """Escribe todo el inventario en el archivo y deja de estar pendiente de guardar."""
+        temporal = archivo + '.tmp'
+        with self._cerrojo:
+            try:
+                with open(temporal, 'w') as f:
+                    json.dump({id_prod: vars(prod) for id_prod, prod in self.productos.items()}, f, indent=4)  # Guardar productos en JSON
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temporal, archivo)  # Un fallo a mitad de escritura no toca el archivo anterior
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(temporal)
+                raise  # Sigue sucio: los cambios no se pierden
+            if self._temporizador:
+                self._temporizador.cancel()  # Este guardado ya incluye los cambios pendientes
+                self._temporizador = None
+            self._sucio = False
+
+    def _marcar_cambio(self):
+        """Marca el inventario como modificado y programa un guardado en segundo plano."""
+        self._sucio = True
+        self._ultimo_cambio = time.monotonic()
+        if self._temporizador is None:
+            self._primer_cambio = self._ultimo_cambio
+            self._programar(self.retraso)
+        if not self._salida_registrada:
+            # Lo pendiente se guarda al salir del programa
+            atexit.register(_guardar_al_salir, weakref.ref(self))
+            self._salida_registrada = True
+
+    def _programar(self, espera):
+        # Crear un temporizador por cambio sería caro en una ráfaga: hay uno solo, y al vencer
+        # vuelve a programarse si siguieron llegando cambios (ver _al_vencer)
+        self._temporizador = threading.Timer(espera, self._al_vencer)
+        self._temporizador.daemon = True
+        self._temporizador.start()
+
+    def _al_vencer(self):
+        """Guarda si pasaron self.retraso segundos sin cambios o se llegó a self.retraso_maximo."""
+        with self._cerrojo:
+            if self._temporizador is not threading.current_thread():
+                return  # Un guardado posterior ya incluyó los cambios de este temporizador
+            ahora = time.monotonic()
+            vence = min(self._ultimo_cambio + self.retraso, self._primer_cambio + self.retraso_maximo)
+            if ahora < vence:
+                self._programar(vence - ahora)  # Hubo cambios nuevos: se espera a que se calmen
+            else:
+                self._temporizador = None
+                self.flush()
+
+    def flush(self):
+        """Guarda los cambios pendientes (si los hay). Devuelve True si escribió el archivo."""
+        with self._cerrojo:
+            if not self._sucio:
+                return False
+            try:
+                self._escribir(self.archivo)
+                return True
+            except Exception as e:
+                self._temporizador = None  # El próximo cambio programa otro intento
+                print(f"Error inesperado al guardar el inventario: {e}")
+                return False
+
     def agregar_producto(self, producto):
         """Agrega un nuevo producto al inventario."""
-        if producto.id_producto in self.productos:
-            print("Producto ya existe.")
+        with self._cerrojo:
+            if producto.id_producto in self.productos:
+                print("Producto ya existe.")
+            else:
+                self.productos[producto.id_producto] = producto  # Agregar producto al diccionario
+                print(f"Producto {producto.id_producto} agregado.")
+                self._marcar_cambio()  # Se guarda en segundo plano
+
+    def eliminar_producto(self, id_producto):
+        """Elimina un producto del inventario si existe."""
+        with self._cerrojo:
+            if id_producto in self.productos:
+                del self.productos[id_producto]  # Eliminar producto del diccionario
+                print(f"Producto {id_producto} eliminado.")
+                self._marcar_cambio()  # Se guarda en segundo plano
+            else:
+                print("Producto no encontrado.")
+
+    def actualizar_producto(self, id_producto, cantidad=None, precio=None):
+        """Actualiza la cantidad o el precio de un producto en el inventario."""
+        with self._cerrojo:
+            if id_producto in self.productos:
+                if cantidad is not None:
+                    self.productos[id_producto].cantidad = cantidad  # Actualizar cantidad
+                if precio is not None:
+                    self.productos[id_producto].precio = precio  # Actualizar precio
+                print(f"Producto {id_producto} actualizado.")
+                self._marcar_cambio()  # Se guarda en segundo plano
+            else:
+                print("Producto no encontrado.")
+
+    def buscar_producto(self, nombre_producto):
+        """Busca productos en el inventario por su nombre."""
+        encontrados = [prod for prod in self.productos.values() if nombre_producto.lower() in prod.nombre.lower()]
+        if encontrados:
+            for producto in encontrados:
+                print(producto)  # Mostrar productos encontrados
         else:
-            self.productos[producto.id_producto] = producto  # Agregar producto al diccionario
+            print("Producto no encontrado.")
+
+    def mostrar_inventario(self):
+        """Muestra todos los productos en el inventario."""
+        if not self.productos:
+            print("El inventario está vacío.")
+        else:
+            for producto in self.productos.values():
+                print(producto)  # Imprimir cada producto en el inventario
+
+class InventarioSQLite:
+    """
+    Inventario guardado en una base de datos SQLite, con los mismos métodos que Inventario.
+
+    La tabla productos tiene como clave primaria id_producto (eliminar y actualizar son
+    consultas por clave, sin reescribir todo el archivo) y un índice sobre lower(nombre)
+    para las búsquedas por nombre exacto o por prefijo. La búsqueda de buscar_producto es
+    por subcadena, que ningún índice de este tipo puede resolver: SQLite recorre la tabla,
+    pero sin crear un objeto Producto por fila. La base usa el modo WAL.
+
+    Nota: SQLite solo distingue mayúsculas de minúsculas en letras ASCII (no en tildes ni la Ñ).
+    """
+    def __init__(self):
+        # Constructor de la clase InventarioSQLite; la conexión se abre en cargar_inventario
+        self.conexion = None
+
+    def cargar_inventario(self, archivo='inventario.db'):
+        """Abre (o crea) la base de datos del inventario con su tabla e índice."""
+        try:
+            if not os.path.exists(archivo):
+                print("Archivo de inventario no encontrado. Se creó uno nuevo.")  # connect crea la base
+            self.conexion = sqlite3.connect(archivo)
+            self.conexion.execute("PRAGMA journal_mode=WAL")  # Cada cambio se agrega al archivo -wal
+            with self.conexion:
+                self.conexion.execute(
+                    "CREATE TABLE IF NOT EXISTS productos (id_producto TEXT PRIMARY KEY, nombre TEXT NOT NULL, "
+                    "cantidad INTEGER NOT NULL, precio REAL NOT NULL) WITHOUT ROWID")
+                self.conexion.execute("CREATE INDEX IF NOT EXISTS productos_nombre ON productos (lower(nombre))")
+        except sqlite3.DatabaseError:
+            print("Error al leer el archivo de inventario. Asegúrese de que el formato sea correcto.")
+
+    def guardar_inventario(self, archivo=None):
+        """Confirma los cambios y los vuelca del archivo -wal a la base (archivo se ignora: es la base abierta)."""
+        try:
+            self.conexion.commit()
+            self.conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            print("Inventario guardado correctamente.")
+        except sqlite3.Error as e:
+            print(f"Error inesperado al guardar el inventario: {e}")
+
+    def _ejecutar(self, consulta, parametros):
+        # Ejecuta un cambio en su propia transacción y devuelve cuántas filas modificó
+        with self.conexion:
+            return self.conexion.execute(consulta, parametros).rowcount
+
+    def agregar_producto(self, producto):
+        """Agrega un nuevo producto al inventario."""
+        try:
+            self._ejecutar("INSERT INTO productos VALUES (?, ?, ?, ?)",
+                           (producto.id_producto, producto.nombre, producto.cantidad, producto.precio))
             print(f"Producto {producto.id_producto} agregado.")
-            self.guardar_inventario()  # Guardar cambios inmediatamente
+            print("Inventario guardado correctamente.")
+        except sqlite3.IntegrityError:
+            print("Producto ya existe.")  # La clave primaria no admite IDs repetidos
+        except sqlite3.Error as e:
+            # Por ejemplo, la base está bloqueada por otro programa o hubo un error de disco
+            print(f"Error inesperado al guardar el inventario: {e}")
+
+    def importar(self, productos):
+        """Agrega muchos productos en una sola transacción (los IDs existentes se reemplazan)."""
+        with self.conexion:
+            self.conexion.executemany("INSERT OR REPLACE INTO productos VALUES (?, ?, ?, ?)",
+                                      ((p.id_producto, p.nombre, p.cantidad, p.precio) for p in productos))
 
     def eliminar_producto(self, id_producto):
         """Elimina un producto del inventario si existe."""
-        if id_producto in self.productos:
-            del self.productos[id_producto]  # Eliminar producto del diccionario
+        try:
+            eliminadas = self._ejecutar("DELETE FROM productos WHERE id_producto = ?", (id_producto,))
+        except sqlite3.Error as e:
+            print(f"Error inesperado al guardar el inventario: {e}")
+            return
+        if eliminadas:
             print(f"Producto {id_producto} eliminado.")
-            self.guardar_inventario()  # Guardar cambios inmediatamente
+            print("Inventario guardado correctamente.")
         else:
             print("Producto no encontrado.")
 
     def actualizar_producto(self, id_producto, cantidad=None, precio=None):
         """Actualiza la cantidad o el precio de un producto en el inventario."""
-        if id_producto in self.productos:
-            if cantidad is not None:
-                self.productos[id_producto].cantidad = cantidad  # Actualizar cantidad
-            if precio is not None:
-                self.productos[id_producto].precio = precio  # Actualizar precio
+        try:
+            # coalesce deja el valor actual cuando el nuevo es None
+            actualizadas = self._ejecutar("UPDATE productos SET cantidad = coalesce(?, cantidad), "
+                                          "precio = coalesce(?, precio) WHERE id_producto = ?",
+                                          (cantidad, precio, id_producto))
+        except sqlite3.Error as e:
+            print(f"Error inesperado al guardar el inventario: {e}")
+            return
+        if actualizadas:
             print(f"Producto {id_producto} actualizado.")
-            self.guardar_inventario()  # Guardar cambios inmediatamente
+            print("Inventario guardado correctamente.")
         else:
             print("Producto no encontrado.")
 
     def buscar_producto(self, nombre_producto):
         """Busca productos en el inventario por su nombre."""
-        encontrados = [prod for prod in self.productos.values() if nombre_producto.lower() in prod.nombre.lower()]
+        # LIKE ya ignora mayúsculas (solo en letras ASCII); se escapan sus comodines % y _
+        patron = nombre_producto.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        encontrados = self.conexion.execute(
+            "SELECT * FROM productos WHERE nombre LIKE '%' || ? || '%' ESCAPE '\\'", (patron,)).fetchall()
         if encontrados:
-            for producto in encontrados:
-                print(producto)  # Mostrar productos encontrados
+            for fila in encontrados:
+                print(Producto(*fila))  # Mostrar productos encontrados
         else:
             print("Producto no encontrado.")
 
     def mostrar_inventario(self):
         """Muestra todos los productos en el inventario."""
-        if not self.productos:
+        filas = self.conexion.execute("SELECT * FROM productos")
+        fila = filas.fetchone()
+        if fila is None:
             print("El inventario está vacío.")
-        else:
-            for producto in self.productos.values():
-                print(producto)  # Imprimir cada producto en el inventario
+        while fila is not None:
+            print(Producto(*fila))  # Imprimir cada producto en el inventario
+            fila = filas.fetchone()
+
+    def cerrar(self):
+        """Cierra la conexión con la base."""
+        self.conexion.close()
+
+def benchmark_sqlite(cantidad=10_000, operaciones=200):
+    """Compara el inventario JSON (que reescribe el archivo completo al guardar) con el de SQLite."""
+    carpeta = tempfile.mkdtemp()
+    productos = [Producto(f"P{i:06d}", f"Producto {i}", i % 500, i % 97 + 0.25) for i in range(cantidad)]
+    json_inicial = Inventario()
+    json_inicial.productos = {producto.id_producto: producto for producto in productos}
+    with contextlib.redirect_stdout(io.StringIO()):
+        json_inicial.guardar_inventario(os.path.join(carpeta, "inventario.json"))
+        sqlite_inicial = InventarioSQLite()
+        sqlite_inicial.cargar_inventario(os.path.join(carpeta, "inventario.db"))
+        sqlite_inicial.importar(productos)
+        sqlite_inicial.cerrar()
+    ids = [producto.id_producto for producto in productos[::cantidad // operaciones]][:operaciones]
+    print(f"{cantidad} productos, {len(ids)} operaciones de cada tipo")
+    for nombre, clase, archivo in (("JSON", Inventario, "inventario.json"), ("SQLite", InventarioSQLite, "inventario.db")):
+        tiempos = []
+        with contextlib.redirect_stdout(io.StringIO()):  # Los mensajes de cada operación no se miden
+            inicio = time.perf_counter()
+            inventario = clase()
+            inventario.cargar_inventario(os.path.join(carpeta, archivo))  # Los guardados van al mismo archivo
+            tiempos.append(time.perf_counter() - inicio)
+            for operacion in (lambda i: inventario.buscar_producto(f"Producto {int(i[1:])}"),
+                              lambda i: inventario.actualizar_producto(i, 1, 2.5),
+                              lambda i: inventario.eliminar_producto(i)):
+                inicio = time.perf_counter()
+                for id_producto in ids:
+                    operacion(id_producto)
+                if isinstance(inventario, Inventario):
+                    inventario.flush()  # El guardado pendiente también se mide
+                tiempos.append(time.perf_counter() - inicio)
+            if isinstance(inventario, InventarioSQLite):
+                inventario.cerrar()
+        print(f"  {nombre:<7} carga {tiempos[0] * 1000:8.1f} ms, búsquedas {tiempos[1] * 1000:8.1f} ms, "
+              f"cambios {tiempos[2] * 1000:8.1f} ms, bajas {tiempos[3] * 1000:8.1f} ms")
+    for archivo in os.listdir(carpeta):
+        os.remove(os.path.join(carpeta, archivo))
+    os.rmdir(carpeta)
+
+def benchmark_rafaga(cantidad=10_000, cambios=200):
+    """Mide una ráfaga de cambios guardando después de cada uno contra el guardado agrupado."""
+    carpeta = tempfile.mkdtemp()
+    archivo = os.path.join(carpeta, "inventario.json")
+    print(f"{cantidad} productos, {cambios} cambios")
+    for nombre, guardar_cada_cambio in (("un guardado por cambio", True), ("guardado agrupado", False)):
+        inventario = Inventario()
+        inventario.archivo = archivo
+        inventario.productos = {f"P{i:06d}": Producto(f"P{i:06d}", f"Producto {i}", i % 500, i % 97 + 0.25)
+                                for i in range(cantidad)}
+        escrituras = 0
+        with contextlib.redirect_stdout(io.StringIO()):  # Los mensajes de cada cambio no se miden
+            inicio = time.perf_counter()
+            for i in range(cambios):
+                inventario.actualizar_producto(f"P{i % cantidad:06d}", cantidad=i)
+                if guardar_cada_cambio:
+                    inventario.guardar_inventario()
+                    escrituras += 1
+            escrituras += inventario.flush()
+            total = time.perf_counter() - inicio
+        with open(archivo) as f:
+            correcto = json.load(f)[f"P{(cambios - 1) % cantidad:06d}"]["cantidad"] == cambios - 1
+        print(f"  {nombre:<23} {total * 1000:9.1f} ms, {escrituras:5d} escrituras, archivo final "
+              f"{'correcto' if correcto else 'INCORRECTO'}")
+    os.remove(archivo)
+    os.rmdir(carpeta)
 
 def pedir_entero(mensaje):
     """Solicita un número entero al usuario y maneja errores en la entrada."""
@@ -113,8 +402,8 @@ def pedir_flotante(mensaje):
         except ValueError:
             print("Por favor, ingrese un precio válido.")
 
-def menu():
-    inventario = Inventario()  # Crear instancia de Inventario
+def menu(inventario=None):
+    inventario = inventario or Inventario()  # Crear instancia de Inventario
     inventario.cargar_inventario()  # Cargar inventario desde archivo JSON
 
     while True:
@@ -157,5 +446,12 @@ def menu():
             print("Opción no válida. Intente de nuevo.")
 
 if __name__ == "__main__":
-    menu()  # Iniciar el menú principal
+    if len(sys.argv) > 1 and sys.argv[1] == '--sqlite':
+        menu(InventarioSQLite())  # Usar la base de datos SQLite (inventario.db)
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark-sqlite':
+        benchmark_sqlite()  # Comparar el inventario JSON con el de SQLite
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark-rafaga':
+        benchmark_rafaga()  # Medir una ráfaga de cambios con y sin guardado agrupado
+    else:
+        menu()  # Iniciar el menú principal
 
@@ -1,3 +1,26 @@
+import gc
+import math
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from itertools import islice
+
+
+def trigramas(texto):
+    """
+    Devuelve el conjunto de trigramas (subcadenas de 3 caracteres) del texto en minúsculas.
+
+    Toda subcadena de 3 o más caracteres de un nombre contiene solo trigramas del nombre,
+    por eso sirven para descartar rápido los productos que no pueden coincidir.
+    """
+    texto = texto.lower()
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
 class Producto:
     """
     Clase que representa un producto en el inventario.
@@ -22,17 +45,467 @@ class Producto:
         return f"{self.nombre}, Cantidad: {self.cantidad}, Precio: ${self.precio}"
 
 
+class VistaProducto:
+    """
+    Vista de una fila de ColumnasProductos con la misma interfaz que Producto.
+
+    No guarda datos propios (usa __slots__, sin __dict__): leer o modificar cantidad y precio
+    lee o escribe directamente en las columnas del almacén.
+    """
+
+    __slots__ = ('_columnas', '_fila')
+
+    def __init__(self, columnas, fila):
+        self._columnas = columnas  # Almacén por columnas al que pertenece la fila.
+        self._fila = fila  # Posición del producto en cada columna.
+
+    @property
+    def id_producto(self):
+        return self._columnas.ids[self._fila]
+
+    @property
+    def nombre(self):
+        return self._columnas.nombres[self._fila]
+
+    @property
+    def cantidad(self):
+        return self._columnas.cantidades[self._fila]
+
+    @cantidad.setter
+    def cantidad(self, valor):
+        self._columnas.cantidades[self._fila] = valor
+
+    @property
+    def precio(self):
+        return self._columnas.precios[self._fila]
+
+    @precio.setter
+    def precio(self, valor):
+        self._columnas.precios[self._fila] = valor
+
+    __str__ = Producto.__str__  # Se muestra igual que un Producto.
+
+
+class ColumnasProductos(MutableMapping):
+    """
+    Almacén de productos por columnas, con la interfaz de un diccionario {id_producto: producto}.
+
+    Atributos:
+    - filas: Diccionario {id_producto: fila}.
+    - ids, nombres: Listas con el ID y el nombre (internado con sys.intern) de cada fila.
+    - cantidades: Columna array('q') con las cantidades (enteros de 64 bits).
+    - precios: Columna array('d') con los precios (flotantes de 64 bits).
+    - libres: Filas de productos eliminados que se reutilizan al agregar otros.
+
+    En lugar de un objeto Producto con su __dict__ por cada producto, la cantidad y el precio
+    ocupan 8 bytes cada uno dentro de un array y los nombres repetidos se comparten.
+    """
+
+    def __init__(self):
+        self.filas = {}
+        self.ids = []
+        self.nombres = []
+        self.cantidades = array('q')
+        self.precios = array('d')
+        self.libres = []
+
+    def __getitem__(self, id_producto):
+        return VistaProducto(self, self.filas[id_producto])
+
+    def __setitem__(self, id_producto, producto):
+        # Copia los datos del producto a las columnas; un ID existente conserva su fila.
+        nombre = sys.intern(producto.nombre)
+        fila = self.filas.get(id_producto)
+        if fila is None and self.libres:
+            fila = self.libres.pop()
+            self.filas[id_producto] = fila
+        if fila is None:  # No hay filas libres: se agrega una al final de cada columna.
+            self.filas[id_producto] = len(self.ids)
+            self.ids.append(id_producto)
+            self.nombres.append(nombre)
+            self.cantidades.append(producto.cantidad)
+            self.precios.append(producto.precio)
+        else:
+            self.ids[fila] = id_producto
+            self.nombres[fila] = nombre
+            self.cantidades[fila] = producto.cantidad
+            self.precios[fila] = producto.precio
+
+    def __delitem__(self, id_producto):
+        fila = self.filas.pop(id_producto)
+        self.ids[fila] = None  # Libera las cadenas; la fila queda disponible.
+        self.nombres[fila] = None
+        self.libres.append(fila)
+
+    def __iter__(self):
+        return iter(self.filas)
+
+    def __len__(self):
+        return len(self.filas)
+
+    def __contains__(self, id_producto):
+        return id_producto in self.filas  # Evita crear una vista solo para comprobar si existe.
+
+
+class ResultadoLote:
+    """
+    Resultado de una operación por lotes sobre el inventario.
+
+    Atributos:
+    - aplicados: Cantidad de operaciones aplicadas (0 si hubo fallos, porque el lote es atómico).
+    - fallos: Lista de tuplas (posición en el lote, id_producto, motivo).
+    """
+
+    def __init__(self, aplicados, fallos):
+        self.aplicados = aplicados
+        self.fallos = fallos
+
+    def __bool__(self):
+        # Un resultado es verdadero si el lote se aplicó completo.
+        return not self.fallos
+
+    def __str__(self):
+        if not self.fallos:
+            return f"Lote aplicado: {self.aplicados} operaciones."
+        return f"Lote rechazado: {len(self.fallos)} fallos, no se aplicó ninguna operación."
+
+
+CANTIDAD_MAXIMA = 2 ** 63 - 1  # La mayor cantidad que cabe en una columna array('q').
+
+
+def validar_valores(cantidad, precio):
+    """
+    Devuelve el motivo por el que la cantidad o el precio no son válidos, o None si lo son.
+
+    La cantidad debe caber en un entero de 64 bits y el precio debe ser un flotante finito
+    (InventarioColumnar los guarda en arrays); así un lote no falla a mitad de aplicarse.
+    """
+    if cantidad is not None and (isinstance(cantidad, bool) or not isinstance(cantidad, int)
+                                 or not 0 <= cantidad <= CANTIDAD_MAXIMA):
+        return "Cantidad inválida"
+    if precio is not None and (isinstance(precio, bool) or not isinstance(precio, (int, float))
+                               or not 0 <= precio <= sys.float_info.max):  # También descarta NaN e infinito.
+        return "Precio inválido"
+    return None
+
+
+@contextmanager
+def recolector_pausado():
+    """
+    Pausa el recolector de ciclos durante un bloque que crea muchos objetos sin ciclos (tuplas de claves).
+
+    Con cientos de miles de productos en memoria, cada recolección completa los recorre a todos;
+    en un lote grande eso llega a ser la mitad del tiempo. El recolector es de todo el proceso,
+    así que lo decide quien llama (por ejemplo, una sincronización nocturna que aplica un lote
+    grande), no los métodos del inventario. Al salir se deja como estaba.
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+
+class IndiceOrdenado:
+    """
+    Conjunto ordenado de claves (valor, id_producto) repartido en bloques ordenados.
+
+    Con una sola lista ordenada cada inserción mueve en promedio la mitad de la lista (O(n)).
+    Al partirla en bloques de como mucho 2 * CARGA claves, insertar y borrar cuestan
+    O(log n + CARGA) y recorrer un rango cuesta O(log n + k). No se debe modificar el
+    índice mientras se recorre.
+    """
+
+    CARGA = 512
+    REEMPLAZO_MASIVO = 8  # Con más de 1/8 de las claves cambiadas conviene reconstruir el índice.
+
+    def __init__(self, claves=()):
+        self._construir(sorted(claves))
+
+    def _bloque(self, claves):
+        # Crea un bloque a partir de una lista ordenada de claves (IndiceOrdenadoCompacto lo guarda de otra forma).
+        return claves
+
+    def _construir(self, claves):
+        # Reparte una lista ya ordenada en bloques de CARGA claves.
+        self.bloques = [self._bloque(claves[i:i + self.CARGA]) for i in range(0, len(claves), self.CARGA)]
+        self.maximos = [bloque[-1] for bloque in self.bloques]  # Última clave de cada bloque.
+        self.tamano = len(claves)
+
+    def __len__(self):
+        return self.tamano
+
+    def __iter__(self):
+        for bloque in self.bloques:
+            yield from bloque
+
+    def agregar(self, clave):
+        if not self.bloques:
+            self.bloques.append(self._bloque([clave]))
+            self.maximos.append(clave)
+            self.tamano = 1
+            return
+        # El primer bloque cuyo máximo no es menor que la clave; si es mayor que todo, el último.
+        i = min(bisect_left(self.maximos, clave), len(self.bloques) - 1)
+        bloque = self.bloques[i]
+        insort(bloque, clave)
+        self.maximos[i] = bloque[-1]
+        self.tamano += 1
+        if len(bloque) > 2 * self.CARGA:
+            # El bloque creció demasiado: se parte en dos mitades.
+            self.bloques.insert(i + 1, bloque[self.CARGA:])
+            del bloque[self.CARGA:]
+            self.maximos.insert(i, bloque[-1])
+
+    def agregar_varios(self, claves):
+        claves = list(claves)
+        if len(claves) > self.tamano:
+            # Para lotes grandes es más barato ordenar todo de nuevo que insertar de a una.
+            self._construir(sorted(list(self) + claves))
+        else:
+            for clave in claves:
+                self.agregar(clave)
+
+    def reemplazar_varios(self, viejas, nuevas):
+        # Cambia las claves viejas por las nuevas (por ejemplo, al actualizar precios en lote).
+        if len(nuevas) * self.REEMPLAZO_MASIVO > self.tamano:
+            # Muchos cambios: se filtra el índice en una pasada y se mezclan dos listas ordenadas
+            # (sorted reconoce las dos secuencias ya ordenadas y solo las intercala).
+            viejas = set(viejas)
+            self._construir(sorted([clave for clave in self if clave not in viejas] + sorted(nuevas)))
+        else:
+            for clave in viejas:
+                self.quitar(clave)
+            for clave in nuevas:
+                self.agregar(clave)
+
+    def quitar(self, clave):
+        i = bisect_left(self.maximos, clave)
+        if i == len(self.bloques):
+            return  # La clave no está en el índice.
+        bloque = self.bloques[i]
+        j = bisect_left(bloque, clave)
+        if bloque[j] != clave:
+            return
+        del bloque[j]
+        self.tamano -= 1
+        if bloque:
+            self.maximos[i] = bloque[-1]
+        else:
+            del self.bloques[i]
+            del self.maximos[i]
+
+    def desde(self, minimo, incluido=True):
+        """Recorre en orden ascendente las claves mayores o iguales que minimo (o solo mayores, si incluido=False)."""
+        buscar = bisect_left if incluido else bisect_right
+        i = buscar(self.maximos, minimo)
+        if i == len(self.bloques):
+            return
+        bloque = self.bloques[i]
+        for j in range(buscar(bloque, minimo), len(bloque)):
+            yield bloque[j]
+        for i in range(i + 1, len(self.bloques)):
+            yield from self.bloques[i]
+
+    def descendente(self):
+        """Recorre todas las claves de mayor a menor."""
+        for i in range(len(self.bloques) - 1, -1, -1):
+            yield from reversed(self.bloques[i])
+
+
+class BloqueClaves:
+    """
+    Bloque de IndiceOrdenadoCompacto: las claves (valor, id_producto) en dos columnas.
+
+    Los valores van en un array y los IDs en una lista (que comparte las cadenas del inventario),
+    así que cada clave ocupa unos 16 bytes en lugar de una tupla con su número. Se comporta como
+    la lista de tuplas que reemplaza: bisect, insort, del y las porciones funcionan igual, y las
+    tuplas se crean solo al leer una clave.
+    """
+
+    __slots__ = ('valores', 'ids')
+
+    def __init__(self, tipo, claves=()):
+        self.valores = array(tipo, [valor for valor, _ in claves])
+        self.ids = [id_producto for _, id_producto in claves]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, posicion):
+        if isinstance(posicion, slice):
+            bloque = BloqueClaves(self.valores.typecode)
+            bloque.valores = self.valores[posicion]
+            bloque.ids = self.ids[posicion]
+            return bloque
+        return self.valores[posicion], self.ids[posicion]
+
+    def __delitem__(self, posicion):
+        del self.valores[posicion]
+        del self.ids[posicion]
+
+    def __iter__(self):
+        return zip(self.valores, self.ids)
+
+    def __reversed__(self):
+        return zip(reversed(self.valores), reversed(self.ids))
+
+    def insert(self, posicion, clave):
+        # Lo usa insort para agregar la clave en su lugar.
+        self.valores.insert(posicion, clave[0])
+        self.ids.insert(posicion, clave[1])
+
+
+class IndiceOrdenadoCompacto(IndiceOrdenado):
+    """IndiceOrdenado cuyos bloques son BloqueClaves; tipo es el del array de valores ('q' o 'd')."""
+
+    def __init__(self, tipo, claves=()):
+        self.tipo = tipo
+        super().__init__(claves)
+
+    def _bloque(self, claves):
+        return BloqueClaves(self.tipo, claves)
+
+
 class Inventario:
     """
     Clase que gestiona un conjunto de productos en el inventario.
 
     Atributos:
     - productos: Diccionario que almacena los productos, usando el ID del producto como clave.
+    - indice_trigramas: Índice invertido {trigrama: IDs de productos cuyo nombre lo contiene}.
+    - indices_ordenados: {campo: IndiceOrdenado de (valor, id_producto)} para 'cantidad' y 'precio'.
+    - ids_ordenados: IndiceOrdenado de los IDs; da un orden estable para paginar con cursor.
+    - total_unidades, valor_total: Suma de cantidades y de cantidad * precio, al día en cada cambio.
+    - subtotales_prefijo: {prefijo del nombre en minúsculas: [productos, unidades, valor]} para
+      los prefijos de hasta LARGO_PREFIJO caracteres.
     """
 
+    LARGO_PREFIJO = 3  # Largo máximo de los prefijos con subtotal; cada cambio cuesta O(LARGO_PREFIJO).
+
     def __init__(self):
         # Inicializa un objeto Inventario que contiene un diccionario de productos.
         self.productos = {}  # Se utiliza un diccionario para un acceso rápido a los productos por su ID.
+        self.indice_trigramas = defaultdict(set)  # Permite buscar por nombre sin recorrer todo el inventario.
+        # Permiten consultar rangos y los k mayores/menores sin recorrer todo el inventario.
+        self.indices_ordenados = {'cantidad': IndiceOrdenado(), 'precio': IndiceOrdenado()}
+        self.ids_ordenados = IndiceOrdenado()  # Orden por ID para recorrer el inventario por páginas.
+        # Agregados que se actualizan con cada cambio para leerlos sin recorrer el inventario.
+        self.total_unidades = 0
+        self.valor_total = 0.0
+        self.subtotales_prefijo = {}
+
+    def _indexar(self, producto):
+        # Registra el nombre del producto en el índice de trigramas.
+        for trigrama in trigramas(producto.nombre):
+            self.indice_trigramas[trigrama].add(producto.id_producto)
+
+    def _desindexar(self, producto):
+        # Quita el nombre del producto del índice; los trigramas que quedan vacíos se eliminan.
+        for trigrama in trigramas(producto.nombre):
+            ids = self.indice_trigramas[trigrama]
+            ids.discard(producto.id_producto)
+            if not ids:
+                del self.indice_trigramas[trigrama]
+
+    def _acumular(self, producto, signo):
+        # Suma (signo=1) o resta (signo=-1) el producto de los agregados y de los subtotales por prefijo.
+        unidades = signo * producto.cantidad
+        valor = unidades * producto.precio
+        self.total_unidades += unidades
+        self.valor_total += valor
+        nombre = producto.nombre.lower()
+        for largo in range(1, min(len(nombre), self.LARGO_PREFIJO) + 1):
+            subtotal = self.subtotales_prefijo.get(nombre[:largo])
+            if subtotal is None:
+                subtotal = self.subtotales_prefijo[nombre[:largo]] = [0, 0, 0.0]
+            subtotal[0] += signo
+            subtotal[1] += unidades
+            subtotal[2] += valor
+            if not subtotal[0]:
+                del self.subtotales_prefijo[nombre[:largo]]  # Ya no hay productos con este prefijo.
+
+    # Operaciones internas: las usan tanto los métodos individuales como los de lotes,
+    # y son el único lugar donde se modifican productos e índices.
+    def _insertar(self, productos):
+        for producto in productos:
+            self.productos[producto.id_producto] = producto  # Agrega el producto al diccionario.
+            self._indexar(producto)  # Mantiene el índice de búsqueda al día.
+            self._acumular(producto, 1)
+        for campo, indice in self.indices_ordenados.items():
+            indice.agregar_varios((getattr(producto, campo), producto.id_producto) for producto in productos)
+        self.ids_ordenados.agregar_varios(producto.id_producto for producto in productos)
+
+    def _quitar(self, id_producto):
+        producto = self.productos[id_producto]
+        self._desindexar(producto)  # Quita el nombre del índice de búsqueda.
+        self._acumular(producto, -1)
+        for campo, indice in self.indices_ordenados.items():
+            indice.quitar((getattr(producto, campo), id_producto))
+        self.ids_ordenados.quitar(id_producto)
+        del self.productos[id_producto]
+
+    def _reindexar(self, campo, producto, valor):
+        # Mueve la clave del producto en el índice ordenado del campo antes de cambiar su valor.
+        anterior = getattr(producto, campo)
+        if anterior != valor:
+            indice = self.indices_ordenados[campo]
+            indice.quitar((anterior, producto.id_producto))
+            indice.agregar((valor, producto.id_producto))
+
+    def _modificar(self, id_producto, cantidad, precio):
+        producto = self.productos[id_producto]
+        self._acumular(producto, -1)  # Se resta con los valores viejos y se vuelve a sumar con los nuevos.
+        if cantidad is not None:
+            self._reindexar('cantidad', producto, cantidad)
+            producto.cantidad = cantidad  # Actualiza la cantidad si se proporciona.
+        if precio is not None:
+            self._reindexar('precio', producto, precio)
+            producto.precio = precio  # Actualiza el precio si se proporciona.
+        self._acumular(producto, 1)
+
+    def _modificar_varios(self, actualizaciones):
+        # Versión de _modificar para lotes: escribe los campos directamente y después ajusta
+        # agregados e índices una sola vez por producto, en lugar de restar, sumar y mover
+        # claves en cada actualización.
+        productos = self.productos
+        anteriores = {}  # {id_producto: (producto, cantidad, precio) antes del lote}
+        for id_producto, cantidad, precio in actualizaciones:
+            producto = productos[id_producto]
+            if id_producto not in anteriores:
+                anteriores[id_producto] = (producto, producto.cantidad, producto.precio)
+            if cantidad is not None:
+                producto.cantidad = cantidad
+            if precio is not None:
+                producto.precio = precio
+        viejas_cantidad, nuevas_cantidad, viejas_precio, nuevas_precio = [], [], [], []
+        diferencias = defaultdict(lambda: [0, 0.0])  # {prefijo más largo del nombre: [unidades, valor]}
+        largo_prefijo = self.LARGO_PREFIJO
+        for id_producto, (producto, cantidad, precio) in anteriores.items():
+            cantidad_nueva, precio_nuevo = producto.cantidad, producto.precio
+            diferencia = diferencias[producto.nombre.lower()[:largo_prefijo]]
+            diferencia[0] += cantidad_nueva - cantidad
+            diferencia[1] += cantidad_nueva * precio_nuevo - cantidad * precio
+            if cantidad_nueva != cantidad:
+                viejas_cantidad.append((cantidad, id_producto))
+                nuevas_cantidad.append((cantidad_nueva, id_producto))
+            if precio_nuevo != precio:
+                viejas_precio.append((precio, id_producto))
+                nuevas_precio.append((precio_nuevo, id_producto))
+        # Cada prefijo largo reparte su diferencia entre sus prefijos más cortos, una vez por prefijo
+        # y no una vez por producto.
+        subtotales = self.subtotales_prefijo
+        for prefijo, (unidades, valor) in diferencias.items():
+            self.total_unidades += unidades
+            self.valor_total += valor
+            for largo in range(1, len(prefijo) + 1):
+                subtotal = subtotales[prefijo[:largo]]  # Existe: los productos ya estaban en el inventario.
+                subtotal[1] += unidades
+                subtotal[2] += valor
+        self.indices_ordenados['cantidad'].reemplazar_varios(viejas_cantidad, nuevas_cantidad)
+        self.indices_ordenados['precio'].reemplazar_varios(viejas_precio, nuevas_precio)
 
     def agregar_producto(self, producto):
         """
@@ -43,7 +516,7 @@ class Inventario:
         if producto.id_producto in self.productos:
             print("Error: Producto ya existe.")  # Evita duplicados en el inventario.
         else:
-            self.productos[producto.id_producto] = producto  # Agrega el producto al diccionario.
+            self._insertar((producto,))
 
     def eliminar_producto(self, id_producto):
         """
@@ -52,7 +525,7 @@ class Inventario:
         Si el producto no se encuentra, se muestra un mensaje de error.
         """
         if id_producto in self.productos:
-            del self.productos[id_producto]  # Elimina el producto si existe.
+            self._quitar(id_producto)  # Elimina el producto si existe.
         else:
             print("Error: Producto no encontrado.")  # Manejo de errores si el producto no existe.
 
@@ -63,22 +536,229 @@ class Inventario:
         Si el producto no se encuentra, se muestra un mensaje de error.
         """
         if id_producto in self.productos:
-            if cantidad is not None:
-                self.productos[id_producto].cantidad = cantidad  # Actualiza la cantidad si se proporciona.
-            if precio is not None:
-                self.productos[id_producto].precio = precio  # Actualiza el precio si se proporciona.
+            self._modificar(id_producto, cantidad, precio)
         else:
             print("Error: Producto no encontrado.")  # Manejo de errores si el producto no existe.
 
+    def agregar_productos(self, productos):
+        """
+        Agrega varios productos de una vez y devuelve un ResultadoLote.
+
+        Todo el lote se valida en una sola pasada (IDs repetidos o existentes, cantidades y precios
+        inválidos). Si hay algún fallo no se agrega ningún producto; no se imprime nada.
+        """
+        productos = list(productos)
+        fallos = []
+        vistos = set()
+        for posicion, producto in enumerate(productos):
+            id_producto = producto.id_producto
+            if id_producto in vistos:
+                fallos.append((posicion, id_producto, "ID repetido en el lote"))
+            elif id_producto in self.productos:
+                fallos.append((posicion, id_producto, "Producto ya existe"))
+            else:
+                motivo = validar_valores(producto.cantidad, producto.precio)
+                if motivo:
+                    fallos.append((posicion, id_producto, motivo))
+            vistos.add(id_producto)
+        if fallos:
+            return ResultadoLote(0, fallos)
+        self._insertar(productos)
+        return ResultadoLote(len(productos), [])
+
+    def actualizar_productos(self, actualizaciones):
+        """
+        Aplica varias actualizaciones (id_producto, cantidad, precio) y devuelve un ResultadoLote.
+
+        Como en actualizar_producto, None deja el valor sin cambios. Si algún ID no existe o algún
+        valor es inválido no se aplica ninguna actualización; no se imprime nada. Para lotes muy
+        grandes, quien llama puede envolver la llamada en recolector_pausado().
+        """
+        actualizaciones = list(actualizaciones)
+        fallos = []
+        productos = self.productos
+        for posicion, (id_producto, cantidad, precio) in enumerate(actualizaciones):
+            if id_producto not in productos:
+                fallos.append((posicion, id_producto, "Producto no encontrado"))
+            else:
+                motivo = validar_valores(cantidad, precio)
+                if motivo:
+                    fallos.append((posicion, id_producto, motivo))
+        if fallos:
+            return ResultadoLote(0, fallos)
+        self._modificar_varios(actualizaciones)
+        return ResultadoLote(len(actualizaciones), [])
+
+    def resumen(self):
+        """Devuelve los agregados del inventario (productos, unidades y valor total) en tiempo constante."""
+        return {'productos': len(self.productos), 'unidades': self.total_unidades, 'valor': self.valor_total}
+
+    def subtotal_prefijo(self, prefijo):
+        """
+        Devuelve (productos, unidades, valor) de los productos cuyo nombre empieza con el prefijo.
+
+        Para prefijos de hasta LARGO_PREFIJO caracteres el subtotal ya está calculado; para
+        prefijos más largos se recorre el inventario.
+        """
+        prefijo = prefijo.lower()
+        if 0 < len(prefijo) <= self.LARGO_PREFIJO:
+            return tuple(self.subtotales_prefijo.get(prefijo, (0, 0, 0.0)))
+        seleccion = [producto for producto in self.productos.values() if producto.nombre.lower().startswith(prefijo)]
+        return (len(seleccion), sum(producto.cantidad for producto in seleccion),
+                math.fsum(producto.cantidad * producto.precio for producto in seleccion))
+
+    def verificar_agregados(self):
+        """
+        Recalcula los agregados recorriendo todo el inventario y los compara con los mantenidos.
+
+        Devuelve la lista de diferencias encontradas (vacía si todo coincide). Los valores en
+        dinero se comparan con tolerancia, porque la suma incremental de floats acumula redondeo.
+        """
+        diferencias = []
+        unidades = 0
+        valores = []
+        subtotales = {}
+        for producto in self.productos.values():
+            valor = producto.cantidad * producto.precio
+            unidades += producto.cantidad
+            valores.append(valor)
+            nombre = producto.nombre.lower()
+            for largo in range(1, min(len(nombre), self.LARGO_PREFIJO) + 1):
+                subtotal = subtotales.setdefault(nombre[:largo], [0, 0, []])
+                subtotal[0] += 1
+                subtotal[1] += producto.cantidad
+                subtotal[2].append(valor)
+        if unidades != self.total_unidades:
+            diferencias.append(f"Unidades: mantenido {self.total_unidades}, recalculado {unidades}")
+        if not math.isclose(self.valor_total, math.fsum(valores), rel_tol=1e-9, abs_tol=1e-6):
+            diferencias.append(f"Valor: mantenido {self.valor_total}, recalculado {math.fsum(valores)}")
+        for prefijo in sorted(subtotales.keys() | self.subtotales_prefijo.keys()):
+            productos, unidades, valores = subtotales.get(prefijo, (0, 0, []))
+            mantenido = self.subtotales_prefijo.get(prefijo, [0, 0, 0.0])
+            if (mantenido[0] != productos or mantenido[1] != unidades
+                    or not math.isclose(mantenido[2], math.fsum(valores), rel_tol=1e-9, abs_tol=1e-6)):
+                diferencias.append(f"Prefijo {prefijo!r}: mantenido {mantenido}, "
+                                   f"recalculado {[productos, unidades, math.fsum(valores)]}")
+        return diferencias
+
+    def _indice_ordenado(self, campo):
+        if campo not in self.indices_ordenados:
+            raise ValueError(f"Campo sin índice ordenado: {campo!r} (use 'cantidad' o 'precio')")
+        return self.indices_ordenados[campo]
+
+    def productos_en_rango(self, campo, minimo=None, maximo=None):
+        """
+        Devuelve los productos con minimo <= campo <= maximo, ordenados por ese campo y luego por ID.
+
+        campo es 'cantidad' o 'precio'; un límite en None no restringe. Cuesta O(log n + k).
+        Ejemplo: productos_en_rango('cantidad', maximo=4) son los productos con menos de 5 unidades.
+        """
+        indice = self._indice_ordenado(campo)
+        claves = indice.desde((minimo,)) if minimo is not None else iter(indice)
+        resultado = []
+        for valor, id_producto in claves:
+            if maximo is not None and valor > maximo:
+                break  # Las claves están ordenadas: no hay más productos en el rango.
+            resultado.append(self.productos[id_producto])
+        return resultado
+
+    def primeros(self, campo, k, mayores=False):
+        """
+        Devuelve los k productos con menor campo (o mayor, con mayores=True) en O(log n + k).
+
+        Los empates se resuelven por ID (ascendente, o descendente con mayores=True).
+        """
+        indice = self._indice_ordenado(campo)
+        claves = indice.descendente() if mayores else iter(indice)
+        return [self.productos[id_producto] for _, id_producto in islice(claves, k)]
+
+    def recorrer(self, orden='id_producto', despues_de=None, nombre=None, campos=None):
+        """
+        Generador que recorre los productos en orden, sin armar listas ni imprimir.
+
+        - orden: 'id_producto', 'cantidad' o 'precio' (los empates se ordenan por ID).
+        - despues_de: cursor devuelto por pagina(); el recorrido empieza después de ese producto.
+        - nombre: si se indica, solo se recorren los productos cuyo nombre lo contiene.
+        - campos: si se indica (p. ej. ('id_producto', 'cantidad')), se entregan diccionarios
+          solo con esos campos en lugar de los productos.
+        """
+        if orden == 'id_producto':
+            if nombre is not None:
+                # Las coincidencias ya vienen ordenadas por ID desde el índice de trigramas.
+                encontrados = self.coincidencias(nombre)
+                inicio = 0
+                if despues_de is not None:
+                    inicio = bisect_right([producto.id_producto for producto in encontrados], despues_de)
+                productos = islice(encontrados, inicio, None)
+            else:
+                ids = self.ids_ordenados.desde(despues_de, False) if despues_de is not None else iter(self.ids_ordenados)
+                productos = (self.productos[id_producto] for id_producto in ids)
+        else:
+            indice = self._indice_ordenado(orden)
+            claves = indice.desde(despues_de, False) if despues_de is not None else iter(indice)
+            productos = (self.productos[id_producto] for _, id_producto in claves)
+            if nombre is not None:
+                consulta = nombre.lower()
+                productos = (producto for producto in productos if consulta in producto.nombre.lower())
+        if campos is None:
+            yield from productos
+        else:
+            for producto in productos:
+                yield {campo: getattr(producto, campo) for campo in campos}
+
+    def pagina(self, tamano=20, cursor=None, orden='id_producto', nombre=None, campos=None):
+        """
+        Devuelve (productos, cursor_siguiente) con hasta `tamano` productos a partir del cursor.
+
+        cursor_siguiente es None cuando no quedan más productos; si no, se pasa tal cual a la
+        siguiente llamada. Como el cursor es la clave del último producto entregado, la
+        paginación sigue siendo correcta aunque se agreguen o eliminen productos entre páginas.
+        """
+        # Se pide un producto de más para saber si hay otra página sin recorrerla.
+        productos = list(islice(self.recorrer(orden, cursor, nombre), tamano + 1))
+        if len(productos) <= tamano:
+            siguiente = None
+        else:
+            productos.pop()
+            ultimo = productos[-1]
+            siguiente = ultimo.id_producto if orden == 'id_producto' else (getattr(ultimo, orden), ultimo.id_producto)
+        if campos is not None:
+            productos = [{campo: getattr(producto, campo) for campo in campos} for producto in productos]
+        return productos, siguiente
+
+    def coincidencias(self, nombre):
+        """
+        Devuelve los productos cuyo nombre contiene el texto buscado (insensible a mayúsculas/minúsculas).
+
+        Con 3 o más caracteres solo se revisan los candidatos que tienen todos los trigramas de la
+        búsqueda, empezando por el trigrama menos frecuente. Si hasta ese trigrama aparece en más
+        de 1/32 del inventario, recorrerlo entero es más barato: cruzar los conjuntos y confirmar
+        cada candidato cuesta unas 12 veces más por producto que el recorrido lineal.
+        Los resultados se ordenan por ID.
+        """
+        consulta = nombre.lower()
+        conjuntos = sorted((self.indice_trigramas.get(trigrama, set()) for trigrama in trigramas(consulta)), key=len)
+        if not conjuntos or len(conjuntos[0]) > len(self.productos) // 32:
+            # Búsqueda corta (sin trigramas) o poco selectiva: se recorre el inventario.
+            return sorted(self.coincidencias_lineales(nombre), key=lambda producto: producto.id_producto)
+        candidatos = conjuntos[0].intersection(*conjuntos[1:])
+        # Tener todos los trigramas no garantiza la subcadena completa: se confirma cada candidato.
+        return [self.productos[id_producto] for id_producto in sorted(candidatos)
+                if consulta in self.productos[id_producto].nombre.lower()]
+
+    def coincidencias_lineales(self, nombre):
+        # Recorre todo el inventario; se usa para búsquedas cortas y como referencia en el benchmark.
+        consulta = nombre.lower()
+        return [producto for producto in self.productos.values() if consulta in producto.nombre.lower()]
+
     def buscar_producto(self, nombre):
         """
         Busca productos por nombre (insensible a mayúsculas/minúsculas).
 
         Imprime los productos que coinciden con el nombre buscado.
         """
-        for producto in self.productos.values():
-            if nombre.lower() in producto.nombre.lower():  # Compara nombres sin importar mayúsculas/minúsculas.
-                print(producto)  # Imprime el producto si se encuentra.
+        for producto in self.coincidencias(nombre):
+            print(producto)  # Imprime el producto si se encuentra.
 
     def mostrar_inventario(self):
         """
@@ -90,6 +770,305 @@ class Inventario:
             print(producto)  # Imprime cada producto en el inventario.
 
 
+class InventarioColumnar(Inventario):
+    """
+    Inventario que guarda los productos en ColumnasProductos en lugar de un diccionario de objetos.
+
+    Tiene los mismos métodos que Inventario; productos[id] devuelve una VistaProducto.
+    Conviene cuando hay millones de productos y la memoria es el problema. Los índices también
+    son compactos, porque en Inventario ocupan más que los propios productos:
+    - indice_trigramas: {trigrama: array('i') con las filas cuyo nombre lo contiene}, en lugar
+      de un conjunto de IDs. Al eliminar un producto sus filas no se quitan (costaría recorrer
+      cada array): quedan obsoletas, cada candidato se confirma contra las columnas y el índice
+      se reconstruye cuando las entradas obsoletas llegan a la mitad.
+    - indices_ordenados: IndiceOrdenadoCompacto, sin una tupla (valor, id_producto) por producto.
+    Con 100 000 productos (benchmarks_inventario.py --benchmark-memoria) ocupa unos 400 bytes
+    por producto frente a unos 2000 de Inventario, a cambio de lecturas unas dos veces más
+    lentas y búsquedas por nombre bastante más lentas, porque cada producto se arma al leerlo.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.productos = ColumnasProductos()  # Mismo uso que el diccionario, pero por columnas.
+        self.indice_trigramas = defaultdict(lambda: array('i'))
+        self.indices_ordenados = {'cantidad': IndiceOrdenadoCompacto('q'), 'precio': IndiceOrdenadoCompacto('d')}
+        self.entradas_trigramas = 0  # Filas guardadas en el índice de trigramas, vigentes u obsoletas.
+        self.entradas_obsoletas = 0  # Filas de productos eliminados que siguen en el índice.
+
+    def _indexar(self, producto):
+        fila = self.productos.filas[producto.id_producto]  # _insertar ya lo guardó en las columnas.
+        claves = trigramas(producto.nombre)
+        for trigrama in claves:
+            self.indice_trigramas[trigrama].append(fila)
+        self.entradas_trigramas += len(claves)
+
+    def _desindexar(self, producto):
+        self.entradas_obsoletas += len(trigramas(producto.nombre))
+
+    def _quitar(self, id_producto):
+        super()._quitar(id_producto)
+        if self.entradas_obsoletas * 2 > self.entradas_trigramas:
+            self._reconstruir_trigramas()
+
+    def _reconstruir_trigramas(self):
+        # Vuelve a armar el índice de trigramas solo con las filas vigentes.
+        indice = defaultdict(lambda: array('i'))
+        columnas = self.productos
+        for fila, id_producto in enumerate(columnas.ids):
+            if id_producto is not None:
+                for trigrama in trigramas(columnas.nombres[fila]):
+                    indice[trigrama].append(fila)
+        self.indice_trigramas = indice
+        self.entradas_trigramas = sum(map(len, indice.values()))
+        self.entradas_obsoletas = 0
+
+    def coincidencias(self, nombre):
+        # Igual que Inventario.coincidencias, pero los candidatos son filas y pueden estar obsoletas.
+        consulta = nombre.lower()
+        listas = sorted((self.indice_trigramas.get(trigrama, ()) for trigrama in trigramas(consulta)), key=len)
+        if not listas or len(listas[0]) > len(self.productos) // 32:
+            return sorted(self.coincidencias_lineales(nombre), key=lambda producto: producto.id_producto)
+        candidatos = set(listas[0]).intersection(*listas[1:])
+        columnas = self.productos
+        # Una fila obsoleta está libre (ID None) o es de otro producto, que se confirma como cualquiera.
+        encontrados = sorted(columnas.ids[fila] for fila in candidatos
+                             if columnas.ids[fila] is not None and consulta in columnas.nombres[fila].lower())
+        return [columnas[id_producto] for id_producto in encontrados]
+
+
+def mostrar_por_paginas(inventario, tamano=20, **opciones):
+    """
+    Imprime los productos de a una página y pregunta antes de mostrar la siguiente.
+
+    Solo se recorre la página que se muestra, así que listar un inventario enorme no obliga
+    a escribir millones de líneas. Las opciones se pasan a Inventario.pagina.
+    """
+    cursor = None
+    while True:
+        productos, cursor = inventario.pagina(tamano, cursor, **opciones)
+        if productos:
+            print("\n".join(str(producto) for producto in productos))  # Una sola escritura por página.
+        if cursor is None:
+            break  # No quedan más productos.
+        if input("Enter para ver más, 'q' para volver: ").strip().lower() == 'q':
+            break
+
+
+class InventarioConcurrente(Inventario):
+    """
+    Inventario que se puede usar desde varios hilos a la vez (por ejemplo, un pool que atiende pedidos).
+
+    Usa cerrojos por franjas: cada ID cae en una de `franjas` franjas según su hash y las
+    operaciones de consultar-y-modificar sobre ese ID se hacen con el cerrojo de su franja.
+    Dos pedidos del mismo producto nunca se pisan.
+
+    Cambiar la cantidad o el precio (actualizar_producto, descontar_cantidad) solo toma el
+    cerrojo de la franja, así que los pedidos de productos de franjas distintas no se esperan:
+    - Los agregados (unidades, valor y subtotales por prefijo) se acumulan por franja y se
+      suman a los del inventario al leerlos, con todas las franjas tomadas.
+    - Los cambios de claves de los índices ordenados se anotan en la cola de la franja y se
+      aplican, con el cerrojo de índices, cuando una consulta o una baja los necesita.
+    Agregar y eliminar productos sí cambian índices compartidos (trigramas, IDs): además de
+    su franja toman el cerrojo de índices. Orden de los cerrojos: franjas (de menor a mayor)
+    y luego índices.
+
+    Los métodos que imprimen (mostrar_inventario, buscar_producto) son para el menú de un solo hilo.
+    """
+
+    TANDA = 256  # Productos que recorrer() arma con el cerrojo de índices tomado.
+
+    def __init__(self, franjas=64):
+        super().__init__()
+        self.cerrojos = [threading.Lock() for _ in range(franjas)]
+        self.cerrojo_indices = threading.RLock()  # Reentrante: una consulta por nombre pasa por coincidencias.
+        # Lo que cada franja cambió y todavía no se pasó a los agregados ni a los índices ordenados.
+        self.agregados_franja = [[0, 0.0, {}] for _ in range(franjas)]  # [unidades, valor, subtotales]
+        self.pendientes_franja = [deque() for _ in range(franjas)]  # (campo, clave vieja, clave nueva)
+
+    def _franja(self, id_producto):
+        return hash(id_producto) % len(self.cerrojos)
+
+    @contextmanager
+    def _bloquear(self, ids=None):
+        # Toma los cerrojos de las franjas de todos los IDs (de todas, con ids=None),
+        # siempre en el mismo orden para no trabarse.
+        if ids is None:
+            franjas = range(len(self.cerrojos))
+        else:
+            franjas = sorted({self._franja(id_producto) for id_producto in ids})
+        cerrojos = [self.cerrojos[franja] for franja in franjas]
+        for cerrojo in cerrojos:
+            cerrojo.acquire()
+        try:
+            yield
+        finally:
+            for cerrojo in reversed(cerrojos):
+                cerrojo.release()
+
+    # Con el cerrojo de la franja del producto tomado (lo toman todos los métodos públicos).
+    def _acumular(self, producto, signo):
+        agregados = self.agregados_franja[self._franja(producto.id_producto)]
+        unidades = signo * producto.cantidad
+        valor = unidades * producto.precio
+        agregados[0] += unidades
+        agregados[1] += valor
+        nombre = producto.nombre.lower()
+        for largo in range(1, min(len(nombre), self.LARGO_PREFIJO) + 1):
+            subtotal = agregados[2].get(nombre[:largo])
+            if subtotal is None:
+                subtotal = agregados[2][nombre[:largo]] = [0, 0, 0.0]
+            subtotal[0] += signo
+            subtotal[1] += unidades
+            subtotal[2] += valor
+
+    def _reindexar(self, campo, producto, valor):
+        anterior = getattr(producto, campo)
+        if anterior != valor:
+            # deque.append es atómico: no hace falta el cerrojo de índices para anotar el cambio.
+            self.pendientes_franja[self._franja(producto.id_producto)].append(
+                (campo, (anterior, producto.id_producto), (valor, producto.id_producto)))
+
+    def _modificar_varios(self, actualizaciones):
+        # El camino del lote de Inventario escribe los agregados compartidos: aquí cada cambio
+        # va a los agregados y a la cola de su franja, como en actualizar_producto.
+        for id_producto, cantidad, precio in actualizaciones:
+            self._modificar(id_producto, cantidad, precio)
+
+    # Con el cerrojo de índices tomado.
+    def _aplicar_pendientes(self):
+        # Pasa a los índices ordenados los cambios anotados por las franjas. De cada producto
+        # cuenta la clave más vieja y la más nueva; los cambios de un producto están en orden
+        # porque se anotan con el cerrojo de su franja, siempre en la misma cola.
+        cambios = {}  # {(campo, id_producto): [clave vieja, clave nueva]}
+        for cola in self.pendientes_franja:
+            while cola:  # Solo este método saca de las colas, y siempre con el cerrojo de índices.
+                campo, vieja, nueva = cola.popleft()
+                cambio = cambios.get((campo, vieja[1]))
+                if cambio is None:
+                    cambios[(campo, vieja[1])] = [vieja, nueva]
+                else:
+                    cambio[1] = nueva
+        if not cambios:
+            return
+        for campo, indice in self.indices_ordenados.items():
+            viejas, nuevas = [], []
+            for (campo_cambio, _), (vieja, nueva) in cambios.items():
+                if campo_cambio == campo and vieja != nueva:
+                    viejas.append(vieja)
+                    nuevas.append(nueva)
+            indice.reemplazar_varios(viejas, nuevas)
+
+    # Con todas las franjas tomadas.
+    def _consolidar(self):
+        # Suma a los agregados del inventario lo acumulado por cada franja.
+        for agregados in self.agregados_franja:
+            unidades, valor, subtotales = agregados
+            self.total_unidades += unidades
+            self.valor_total += valor
+            for prefijo, parcial in subtotales.items():
+                subtotal = self.subtotales_prefijo.setdefault(prefijo, [0, 0, 0.0])
+                subtotal[0] += parcial[0]
+                subtotal[1] += parcial[1]
+                subtotal[2] += parcial[2]
+                if not subtotal[0]:
+                    del self.subtotales_prefijo[prefijo]  # Ya no hay productos con este prefijo.
+            agregados[:] = [0, 0.0, {}]
+
+    # Agregar y quitar productos cambian los índices compartidos: se hacen con su cerrojo.
+    def _insertar(self, productos):
+        with self.cerrojo_indices:
+            super()._insertar(productos)
+
+    def _quitar(self, id_producto):
+        with self.cerrojo_indices:
+            self._aplicar_pendientes()  # La clave a quitar debe ser la del valor actual.
+            super()._quitar(id_producto)
+
+    def agregar_producto(self, producto):
+        with self.cerrojos[self._franja(producto.id_producto)]:
+            super().agregar_producto(producto)
+
+    def eliminar_producto(self, id_producto):
+        with self.cerrojos[self._franja(id_producto)]:
+            super().eliminar_producto(id_producto)
+
+    def actualizar_producto(self, id_producto, cantidad=None, precio=None):
+        with self.cerrojos[self._franja(id_producto)]:
+            super().actualizar_producto(id_producto, cantidad, precio)
+
+    def agregar_productos(self, productos):
+        productos = list(productos)
+        with self._bloquear(producto.id_producto for producto in productos):
+            return super().agregar_productos(productos)
+
+    def actualizar_productos(self, actualizaciones):
+        actualizaciones = list(actualizaciones)
+        with self._bloquear(id_producto for id_producto, _, _ in actualizaciones):
+            return super().actualizar_productos(actualizaciones)
+
+    def descontar_cantidad(self, id_producto, unidades, esperada=None):
+        """
+        Descuenta `unidades` de la cantidad de un producto de forma atómica y devuelve True si lo hizo.
+
+        No descuenta (y devuelve False) si el producto no existe, si no alcanza el stock o, cuando
+        se indica `esperada`, si la cantidad actual ya no es la esperada (otro hilo la cambió).
+        """
+        with self.cerrojos[self._franja(id_producto)]:
+            producto = self.productos.get(id_producto)
+            if producto is None or producto.cantidad < unidades:
+                return False
+            if esperada is not None and producto.cantidad != esperada:
+                return False
+            self._modificar(id_producto, producto.cantidad - unidades, None)
+            return True
+
+    # Consultas de agregados: con todas las franjas tomadas nadie está cambiando productos.
+    def resumen(self):
+        with self._bloquear():
+            self._consolidar()
+            return super().resumen()
+
+    def subtotal_prefijo(self, prefijo):
+        with self._bloquear():
+            self._consolidar()
+            return super().subtotal_prefijo(prefijo)
+
+    def verificar_agregados(self):
+        with self._bloquear():
+            self._consolidar()
+            return super().verificar_agregados()
+
+    # Consultas por índice: leen los índices, que otro hilo puede estar modificando.
+
+    def coincidencias(self, nombre):
+        with self.cerrojo_indices:
+            return super().coincidencias(nombre)
+
+    def productos_en_rango(self, campo, minimo=None, maximo=None):
+        with self.cerrojo_indices:
+            self._aplicar_pendientes()
+            return super().productos_en_rango(campo, minimo, maximo)
+
+    def primeros(self, campo, k, mayores=False):
+        with self.cerrojo_indices:
+            self._aplicar_pendientes()
+            return super().primeros(campo, k, mayores)
+
+    def recorrer(self, orden='id_producto', despues_de=None, nombre=None, campos=None):
+        # Un generador no puede tener el cerrojo tomado mientras espera al que lo consume:
+        # se arman tandas con el cerrojo y se sigue desde el último producto (como pagina()).
+        while True:
+            with self.cerrojo_indices:
+                self._aplicar_pendientes()
+                tanda = list(islice(super().recorrer(orden, despues_de, nombre), self.TANDA))
+            if not tanda:
+                return
+            for producto in tanda:
+                yield producto if campos is None else {campo: getattr(producto, campo) for campo in campos}
+            ultimo = tanda[-1]
+            despues_de = ultimo.id_producto if orden == 'id_producto' else (getattr(ultimo, orden), ultimo.id_producto)
+
+
 def menu():
     """
     Función principal que maneja la interacción con el usuario.
@@ -125,10 +1104,10 @@ def menu():
             inventario.actualizar_producto(id_producto, cantidad, precio)  # Actualiza el producto.
         elif opcion == '4':
             nombre = input("Ingrese el nombre del producto a buscar: ")
-            inventario.buscar_producto(nombre)  # Busca el producto por nombre.
+            mostrar_por_paginas(inventario, nombre=nombre)  # Muestra las coincidencias por páginas.
         elif opcion == '5':
-            inventario.mostrar_inventario()  # Muestra todos los productos en el inventario.
+            mostrar_por_paginas(inventario)  # Muestra el inventario por páginas.
 
 
 if __name__ == "__main__":
-    menu()  # Llama a la función menu para iniciar la aplicación. ```python
+    menu()  # Llama a la función menu para iniciar la aplicación. Los benchmarks están en benchmarks_inventario.py.
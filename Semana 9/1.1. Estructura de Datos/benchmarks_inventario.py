@@ -0,0 +1,213 @@
+"""
+Benchmarks del Sistema de Gestión de Inventarios (3.1.1-1).
+
+Se ejecutan aparte para que el archivo de la tarea quede solo con el inventario y el menú:
+    python benchmarks_inventario.py --benchmark             búsqueda por nombre con y sin índice
+    python benchmarks_inventario.py --benchmark-rangos      consultas por rango con y sin índice ordenado
+    python benchmarks_inventario.py --benchmark-memoria     Inventario frente a InventarioColumnar
+    python benchmarks_inventario.py --benchmark-contencion  descuentos concurrentes con 1 a 32 hilos
+"""
+import gc
+import heapq
+import importlib.util
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+# El nombre del archivo de la tarea tiene espacios, así que no se puede importar con import.
+_RUTA_TAREA = Path(__file__).with_name('3.1.1-1 - Tarea - Sistema de Gestion de Inventarios.py')
+_especificacion = importlib.util.spec_from_file_location('sistema_inventarios', _RUTA_TAREA)
+tarea = importlib.util.module_from_spec(_especificacion)
+sys.modules['sistema_inventarios'] = tarea  # Registrado antes de ejecutarlo, como haría import.
+_especificacion.loader.exec_module(tarea)
+
+Producto = tarea.Producto
+Inventario = tarea.Inventario
+InventarioColumnar = tarea.InventarioColumnar
+InventarioConcurrente = tarea.InventarioConcurrente
+
+
+def generar_productos(cantidad_productos, semilla=0):
+    """Genera productos con nombres combinados al azar (para los benchmarks)."""
+    generador = random.Random(semilla)
+    articulos = ['Arroz', 'Azucar', 'Atun', 'Fideo', 'Leche', 'Aceite', 'Cafe', 'Harina', 'Sal', 'Galletas',
+                 'Jabon', 'Detergente', 'Papel', 'Avena', 'Lenteja', 'Frejol', 'Queso', 'Yogurt', 'Mantequilla']
+    variantes = ['Integral', 'Premium', 'Light', 'Organico', 'Clasico', 'Familiar', 'Extra', 'Natural']
+    marcas = ['Sumesa', 'Real', 'Supermaxi', 'Don Vittorio', 'Nestle', 'Toni', 'La Favorita', 'Oriental']
+    for i in range(cantidad_productos):
+        nombre = (f"{generador.choice(articulos)} {generador.choice(variantes)} {generador.choice(marcas)} "
+                  f"{generador.randint(1, 5000)}g")
+        yield Producto(f"P{i:07d}", nombre, generador.randint(0, 500), round(generador.uniform(0.25, 40), 2))
+
+
+def generar_inventario(cantidad_productos, semilla=0, clase=None):
+    """Crea un inventario (Inventario o la clase indicada) con productos generados al azar."""
+    inventario = (clase or Inventario)()
+    for producto in generar_productos(cantidad_productos, semilla):
+        inventario.agregar_producto(producto)
+    return inventario
+
+
+def benchmark_busqueda(tamanos=(10_000, 100_000, 1_000_000), consultas=('integral', 'nestle', 'leche light',
+                                                                        'don vittorio', '250g', 'harina premium toni'),
+                       repeticiones=3):
+    """
+    Compara la búsqueda por nombre con el índice de trigramas y con el recorrido lineal.
+
+    Ambos caminos entregan los resultados ordenados por ID, como coincidencias(); se toma
+    el mejor tiempo de cada uno, sin el recolector de basura (como timeit).
+    """
+    def medir(funcion):
+        mejor = float('inf')
+        gc.disable()  # Con un millón de productos, una recolección en medio de la medición domina el tiempo
+        try:
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                resultado = funcion()
+                mejor = min(mejor, time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+        return resultado, mejor
+
+    for tamano in tamanos:
+        inicio = time.perf_counter()
+        inventario = generar_inventario(tamano)
+        construccion = time.perf_counter() - inicio
+        print(f"\n{tamano} productos (carga con índice: {construccion:.2f} s)")
+        for consulta in consultas:
+            lineal, tiempo_lineal = medir(lambda: sorted(inventario.coincidencias_lineales(consulta),
+                                                         key=lambda producto: producto.id_producto))
+            indexada, tiempo_indice = medir(lambda: inventario.coincidencias(consulta))
+            assert [p.id_producto for p in lineal] == [p.id_producto for p in indexada]
+            print(f"  '{consulta}': {len(indexada)} resultados, lineal {tiempo_lineal * 1000:9.2f} ms, "
+                  f"trigramas {tiempo_indice * 1000:9.2f} ms ({tiempo_lineal / max(tiempo_indice, 1e-9):.1f}x)")
+
+
+def benchmark_rangos(tamanos=(100_000, 1_000_000), repeticiones=20):
+    """Compara las consultas por rango y los k primeros con índice ordenado y con recorrido lineal."""
+    for tamano in tamanos:
+        inventario = generar_inventario(tamano)
+        print(f"\n{tamano} productos")
+        consultas = (
+            ('cantidad < 5', lambda: inventario.productos_en_rango('cantidad', maximo=4),
+             lambda: [p for p in inventario.productos.values() if p.cantidad <= 4]),
+            ('precio entre 10 y 10.5', lambda: inventario.productos_en_rango('precio', 10, 10.5),
+             lambda: [p for p in inventario.productos.values() if 10 <= p.precio <= 10.5]),
+            ('10 más caros', lambda: inventario.primeros('precio', 10, mayores=True),
+             lambda: heapq.nlargest(10, inventario.productos.values(), key=lambda p: (p.precio, p.id_producto))),
+        )
+        for descripcion, indexada, lineal in consultas:
+            tiempos = []
+            for funcion in (lineal, indexada):
+                inicio = time.perf_counter()
+                for _ in range(repeticiones):
+                    resultado = funcion()
+                tiempos.append((time.perf_counter() - inicio) / repeticiones)
+            print(f"  {descripcion:<24} {len(resultado):6} resultados, lineal {tiempos[0] * 1000:8.2f} ms, "
+                  f"índice {tiempos[1] * 1000:8.3f} ms ({tiempos[0] / max(tiempos[1], 1e-9):.0f}x)")
+
+
+def benchmark_memoria(tamanos=(100_000, 1_000_000), consultas=200_000, busquedas=('leche light', '250g')):
+    """
+    Compara Inventario (diccionario de Producto) con InventarioColumnar, los dos con todos sus índices.
+
+    Informa los bytes por producto que quedan reservados después de cargar el inventario
+    (tracemalloc), las lecturas por segundo de productos[id] y el tiempo medio de una búsqueda
+    por nombre.
+    """
+    for tamano in tamanos:
+        print(f"\n{tamano} productos")
+        for clase in (Inventario, InventarioColumnar):
+            tracemalloc.start()
+            inventario = clase()
+            inventario.agregar_productos(generar_productos(tamano))  # Los Producto temporales se liberan en columnas.
+            gc.collect()
+            memoria, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            productos = inventario.productos
+            ids = random.Random(1).choices(list(productos), k=consultas)
+            inicio = time.perf_counter()
+            total = 0.0
+            for id_producto in ids:
+                producto = productos[id_producto]
+                total += producto.cantidad * producto.precio
+            lectura = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            for consulta in busquedas:
+                inventario.coincidencias(consulta)
+            busqueda = (time.perf_counter() - inicio) / len(busquedas)
+            print(f"  {clase.__name__:<18} {memoria / tamano:7.1f} bytes/producto  "
+                  f"{consultas / lectura / 1e6:6.2f} M lecturas/s  búsqueda {busqueda * 1000:7.2f} ms")
+            del inventario, productos, producto
+
+
+def benchmark_contencion(hilos=(1, 2, 4, 8, 16, 32), operaciones=64_000, productos=10_000):
+    """
+    Mide descuentos por segundo con 1 a 32 hilos sobre claves calientes y frías.
+
+    Calientes: todos los hilos descuentan de los mismos 4 productos. Frías: cada descuento es
+    sobre un producto al azar de todo el inventario. Se compara una sola franja (un cerrojo
+    global) con 64 franjas, y se verifica que no se pierda ningún descuento. Al final se mide
+    con 8 hilos mientras otro hilo hace consultas por rango sobre todo el inventario: los
+    descuentos no toman el cerrojo de índices, así que no esperan a que termine la consulta.
+    """
+    for franjas in (1, 64):
+        for claves in ('calientes', 'frías', 'frías con consulta'):
+            for cantidad_hilos in (hilos if claves != 'frías con consulta' else (8,)):  # Un solo caso con consulta
+                inventario = InventarioConcurrente(franjas)
+                inventario.agregar_productos(Producto(f"P{i:07d}", f"Producto {i}", 10 ** 9, 1.0)
+                                             for i in range(productos))
+                universo = 4 if claves == 'calientes' else productos
+                por_hilo = operaciones // cantidad_hilos
+                con_consulta = claves == 'frías con consulta'
+                barrera = threading.Barrier(cantidad_hilos + 1 + con_consulta)
+                exitos = [0] * cantidad_hilos
+                terminado = threading.Event()
+
+                def consultar():
+                    barrera.wait()
+                    while not terminado.is_set():
+                        inventario.productos_en_rango('cantidad', 0)
+
+                def trabajar(numero):
+                    ids = [f"P{i:07d}" for i in random.Random(numero).choices(range(universo), k=por_hilo)]
+                    barrera.wait()  # Todos los hilos empiezan a la vez.
+                    for id_producto in ids:
+                        exitos[numero] += inventario.descontar_cantidad(id_producto, 1)
+
+                trabajadores = [threading.Thread(target=trabajar, args=(numero,)) for numero in range(cantidad_hilos)]
+                lector = threading.Thread(target=consultar) if con_consulta else None
+                if lector:
+                    lector.start()
+                for trabajador in trabajadores:
+                    trabajador.start()
+                barrera.wait()
+                inicio = time.perf_counter()
+                for trabajador in trabajadores:
+                    trabajador.join()
+                duracion = time.perf_counter() - inicio
+                terminado.set()
+                if lector:
+                    lector.join()
+                descontado = sum(10 ** 9 - producto.cantidad for producto in inventario.productos.values())
+                assert descontado == sum(exitos) == por_hilo * cantidad_hilos  # Ningún descuento perdido.
+                print(f"  {franjas:2} franjas, claves {claves:<18} {cantidad_hilos:2} hilos: "
+                      f"{sum(exitos) / duracion / 1000:7.1f} mil descuentos/s")
+
+
+if __name__ == "__main__":
+    opcion = sys.argv[1] if len(sys.argv) > 1 else '--benchmark'
+    if opcion == '--benchmark':
+        benchmark_busqueda()  # Compara la búsqueda con índice y sin índice.
+    elif opcion == '--benchmark-rangos':
+        benchmark_rangos()  # Compara las consultas por rango con índice ordenado y sin índice.
+    elif opcion == '--benchmark-contencion':
+        benchmark_contencion()  # Mide los descuentos concurrentes con 1 a 32 hilos.
+    elif opcion == '--benchmark-memoria':
+        benchmark_memoria()  # Compara el diccionario de objetos con el almacén por columnas.
+    else:
+        print(__doc__)